@@ -23,6 +23,17 @@ class PlayerMove(Enum):
     PAPER = "paper"
     SCISSORS = "scissors"
 
+# Bound once; randrange skips randint's extra call layer
+_randrange = random.randrange
+
+# How each game type shows a player's result in the final status
+_RESULT_FORMATS = {
+    GameType.DICE_ROLL: lambda roll: f"Rolled {roll}",
+    GameType.COIN_FLIP: str,
+    GameType.NUMBER_GUESS: lambda guess: f"Guessed {guess}",
+    GameType.ROCK_PAPER_SCISSORS: lambda move: move.value,
+}
+
 # Store active betting games: {game_id: BettingGame}
 active_betting_games = {}
 
@@ -67,6 +78,12 @@ class BettingGame:
         # Store message IDs to update all players
         self.player_messages = {}  # {player_id: (chat_id, message_id)}
         
+        # Bumped whenever players, moves or results change; the status text is
+        # cached against it (plus the fields handlers assign directly)
+        self._version = 0
+        self._status_key = None
+        self._status_text = ""
+        
         # For single-player games, add a bot player automatically
         if single_player:
             self.players.add(-1)  # -1 represents the bot
@@ -76,7 +93,7 @@ class BettingGame:
         
         # Specific game settings
         if game_type == GameType.NUMBER_GUESS:
-            self.target_number = random.randint(1, 10)
+            self.target_number = _randrange(1, 11)
         
     def add_player(self, player_id: int) -> bool:
         """
@@ -95,6 +112,7 @@ class BettingGame:
             return False
             
         self.players.add(player_id)
+        self._version += 1
         
         # Initialize player_messages entry for this player to make sure they receive updates
         # This will be updated later with the actual chat_id and message_id
@@ -125,6 +143,7 @@ class BettingGame:
             
         # Record the move
         self.player_moves[player_id] = move
+        self._version += 1
         
         # Check if all players have made their moves
         if len(self.player_moves) == len(self.players):
@@ -136,6 +155,7 @@ class BettingGame:
     def _determine_winner(self) -> None:
         """Determine the winner based on the game type and moves."""
         self.is_tie = False  # Track if the game ended in a tie
+        self._version += 1
         
         if self.game_type == GameType.DICE_ROLL:
             # Highest roll wins
@@ -241,8 +261,24 @@ class BettingGame:
                 # Player 2 wins
                 self.winner_id = p2
     
+    def display_name(self, player_id: int) -> str:
+        """Name to show for a player: the bot, their @username, or their ID."""
+        if player_id == -1:
+            return "🤖 Bot"
+        if player_id in self.player_usernames:
+            return f"@{self.player_usernames[player_id]}"
+        return f"Player {player_id}"
+    
     def get_status_text(self) -> str:
-        """Get a text description of the current game state."""
+        """Get a text description of the current game state, cached until the game changes."""
+        key = (self._version, self.state, len(self.player_usernames))
+        if key != self._status_key:
+            self._status_text = self._render_status_text()
+            self._status_key = key
+        return self._status_text
+    
+    def _render_status_text(self) -> str:
+        """Build the status text for the current game state."""
         game_name = self.game_type.value.replace("_", " ").title()
         
         if self.state == GameState.WAITING_FOR_PLAYER:
@@ -270,60 +306,16 @@ class BettingGame:
         elif self.state == GameState.GAME_OVER:
             result_text = ""
             
-            # Format the results based on game type
-            if self.game_type == GameType.DICE_ROLL:
-                for player_id, roll in self.results.items():
-                    # Use username if available, otherwise fallback to ID
-                    if player_id == -1:
-                        player_name = "🤖 Bot"
-                    elif player_id in self.player_usernames:
-                        player_name = f"@{self.player_usernames[player_id]}"
-                    else:
-                        player_name = f"Player {player_id}"
-                        
-                    # For a tie game, don't show winner mark
-                    winner_mark = "🏆 " if player_id == self.winner_id and not self.is_tie else ""
-                    result_text += f"{winner_mark}{player_name}: Rolled {roll}\n"
-                    
-            elif self.game_type == GameType.COIN_FLIP:
-                for player_id, result in self.results.items():
-                    # Use username if available, otherwise fallback to ID
-                    if player_id == -1:
-                        player_name = "🤖 Bot"
-                    elif player_id in self.player_usernames:
-                        player_name = f"@{self.player_usernames[player_id]}"
-                    else:
-                        player_name = f"Player {player_id}"
-                        
-                    winner_mark = "🏆 " if player_id == self.winner_id and not self.is_tie else ""
-                    result_text += f"{winner_mark}{player_name}: {result}\n"
-                    
-            elif self.game_type == GameType.NUMBER_GUESS:
-                result_text += f"Target Number: {self.target_number}\n\n"
-                for player_id, guess in self.results.items():
-                    # Use username if available, otherwise fallback to ID
-                    if player_id == -1:
-                        player_name = "🤖 Bot"
-                    elif player_id in self.player_usernames:
-                        player_name = f"@{self.player_usernames[player_id]}"
-                    else:
-                        player_name = f"Player {player_id}"
-                        
-                    winner_mark = "🏆 " if player_id == self.winner_id and not self.is_tie else ""
-                    result_text += f"{winner_mark}{player_name}: Guessed {guess}\n"
-                    
-            elif self.game_type == GameType.ROCK_PAPER_SCISSORS:
-                for player_id, move in self.results.items():
-                    # Use username if available, otherwise fallback to ID
-                    if player_id == -1:
-                        player_name = "🤖 Bot"
-                    elif player_id in self.player_usernames:
-                        player_name = f"@{self.player_usernames[player_id]}"
-                    else:
-                        player_name = f"Player {player_id}"
-                        
-                    winner_mark = "🏆 " if player_id == self.winner_id and not self.is_tie else ""
-                    result_text += f"{winner_mark}{player_name}: {move.value}\n"
+            # Format the results based on game type, one line per player
+            result_lines = []
+            if self.game_type == GameType.NUMBER_GUESS:
+                result_lines.append(f"Target Number: {self.target_number}\n")
+            describe = _RESULT_FORMATS[self.game_type]
+            for player_id, result in self.results.items():
+                # For a tie game, don't show winner mark
+                winner_mark = "🏆 " if player_id == self.winner_id and not self.is_tie else ""
+                result_lines.append(f"{winner_mark}{self.display_name(player_id)}: {describe(result)}")
+            result_text = "\n".join(result_lines) + "\n" if result_lines else ""
             
             # Determine winnings and result message
             total_pot = self.bet_amount * len(self.players)
@@ -339,20 +331,11 @@ class BettingGame:
                 )
             else:
                 # There's a clear winner
-                # Get winner name for display
-                winner_name = ""
-                if self.winner_id == -1:
-                    winner_name = "🤖 Bot"
-                elif self.winner_id in self.player_usernames:
-                    winner_name = f"@{self.player_usernames[self.winner_id]}"
-                else:
-                    winner_name = f"Player {self.winner_id}"
-                    
                 return (
                     f"🎮 *{game_name} Betting Game - FINISHED*\n\n"
                     f"Game ID: `{self.game_id}`\n"
                     f"Results:\n{result_text}\n"
-                    f"Winner: {winner_name}\n"
+                    f"Winner: {self.display_name(self.winner_id)}\n"
                     f"Winnings: {total_pot} credits\n"
                 )
         
@@ -379,11 +362,11 @@ def create_betting_game(game_type: GameType, creator_id: int, bet_amount: int, s
     if single_player:
         # Bot makes a move based on game type
         if game_type == GameType.DICE_ROLL:
-            bot_move = random.randint(1, 6)
+            bot_move = _randrange(1, 7)
         elif game_type == GameType.COIN_FLIP:
             bot_move = random.choice(["heads", "tails"])
         elif game_type == GameType.NUMBER_GUESS:
-            bot_move = random.randint(1, 10)
+            bot_move = _randrange(1, 11)
         elif game_type == GameType.ROCK_PAPER_SCISSORS:
             bot_move = random.choice([
                 PlayerMove.ROCK, 
@@ -3,40 +3,30 @@ Bot initialization and setup.
 """
 import os
 import sys
+import ast
 import logging
 import asyncio
+import functools
+import math
+import operator
 import time
 import re
+import io
 import json
 import random
+import shutil
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Set, Optional, Any
 
-# For dealing with Telegram's async deprecation warnings
-import nest_asyncio
-nest_asyncio.apply()
+import aiofiles
+import aiofiles.os
+import aiohttp
+import orjson
+from PIL import Image, ImageDraw, ImageFont
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler
-from telegram.ext import filters, ContextTypes, ChatMemberHandler
-
-from api_client import AIApiClient
-from conversation import ConversationManager
-from message_counter import MessageCounter
-import handlers.betting_handlers
-import handlers.translate_handlers
-import handlers.message_handlers
-import handlers.photo_handlers
-import handlers.game_handlers
-import handlers.command_handlers
-import os
-import logging
-import random
-import re
-from datetime import datetime
-import nest_asyncio
-nest_asyncio.apply()
-
-from telegram import Update, InputMediaPhoto, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update, InputMediaPhoto, InputMediaVideo, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import RetryAfter
 from telegram.ext import (
     Application, 
     CommandHandler, 
@@ -47,13 +37,23 @@ from telegram.ext import (
     ContextTypes
 )
 
+from api_client import AIApiClient
 from conversation import ConversationManager
 from message_counter import MessageCounter
-from api_client import AIApiClient
-from config import BOT_TOKEN, game_states, DOWNLOADS_FOLDER
+from config import BOT_TOKEN, game_states, DOWNLOADS_FOLDER, MAX_FILE_SIZE
 import utils.helpers as helpers
+from services.google_search import GoogleSearchService
+from services.social_media_service import SocialMediaService
+from services.translate_service import TranslationService
+import handlers.betting_handlers
+import handlers.translate_handlers
+import handlers.message_handlers
+import handlers.photo_handlers
+import handlers.game_handlers
+import handlers.command_handlers
 from handlers.command_handlers import search_command, scrape_command, youtube_command
-from handlers.message_handlers import handle_callback
+from handlers.message_handlers import handle_callback, process_youtube_url, process_social_media_url
+from handlers.crypto_handlers import register_crypto_handlers
 from handlers.photo_handlers import handle_photo, analyze_command
 from handlers.game_handlers import checkers_command, end_checkers_command, move_checkers_command, handle_checkers_callback, handle_checkers_move_message
 
@@ -63,6 +63,37 @@ logger = logging.getLogger(__name__)
 conversation_manager = ConversationManager()
 message_counter = MessageCounter()
 
+# Placeholder bar shown for a new guessing game (hides the number's position)
+_FAKE_PROGRESS_BAR = "⬜️" * 10
+
+# Maximum number of TikTok slides uploaded one by one at the same time
+_SLIDE_UPLOAD_CONCURRENCY = 4
+# Attempts per slide when Telegram answers with flood control (RetryAfter)
+_SLIDE_UPLOAD_ATTEMPTS = 3
+
+# Fire-and-forget cleanup tasks, referenced here until they finish
+_BACKGROUND_TASKS: Set[asyncio.Task] = set()
+
+# Patterns used by handle_message on every incoming text
+_URL_RE = re.compile(r'https?://\S+')
+# Simple pattern: numbers and math operators
+_MATH_OPERATORS = frozenset("+-*/^%")
+_MATH_EXPR_RE = re.compile(r'[-+]?[0-9]*\.?[0-9]+[\+\-\*\/\^%][0-9\+\-\*\/\^\(\)\.\s%]*')
+
+# Media extensions sent as photos / videos (anything else goes as a document)
+_IMG_EXT = frozenset({'.jpg', '.jpeg', '.png', '.webp'})
+_VID_EXT = frozenset({'.mp4', '.avi', '.mkv', '.mov'})
+
+# Keep-alive HTTP session reused by translate_text (closed on shutdown)
+_TRANSLATE_SESSION: Optional[aiohttp.ClientSession] = None
+
+# Give up on slow translation responses instead of letting requests pile up
+_TRANSLATE_TIMEOUT = aiohttp.ClientTimeout(total=5.0)
+
+# LRU cache of recent translations keyed by (text, target_lang, source_lang)
+_TRANSLATION_CACHE: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_TRANSLATION_CACHE_SIZE = 2048
+
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send a message when the command /start is issued."""
     welcome_text = (
@@ -209,21 +240,11 @@ async def fun_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         game_number = random.randint(1, 100)
         game_states[user_id] = {"number": game_number, "attempts": 0}
         
-        # Create a progress bar of 10 segments to represent 1-100
-        segment = game_number // 10  # Which segment the number falls into
-        progress_segments = ["⬜️"] * 10
-        for i in range(0, segment):
-            progress_segments[i] = "🟩"
-        progress_bar = "".join(progress_segments)
-        
-        # Hide the actual position with a fake progress bar
-        fake_progress_bar = "⬜️" * 10
-        
         game_message = (
             "🎮 *Number Guessing Game* 🎮\n\n"
             "I'm thinking of a number between *1 and 100*.\n"
             "Can you guess what it is?\n\n"
-            f"Progress: {fake_progress_bar}\n\n"
+            f"Progress: {_FAKE_PROGRESS_BAR}\n\n"
             "Reply with your guess (1-100)!"
         )
         
@@ -277,7 +298,6 @@ async def image_search(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     chat_id = update.effective_chat.id
     
     # Generate a unique timestamp for this search
-    import time
     timestamp = int(time.time())
     
     # Get the original search term
@@ -293,7 +313,6 @@ async def image_search(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         context.chat_data['image_search_history'] = {}
         
     # Adjust the search term if we've seen this search before
-    import random
     search_history = context.chat_data['image_search_history']
     if search_key in search_history:
         # If the same search has been used recently, add variety
@@ -324,8 +343,6 @@ async def image_search(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     )
     
     try:
-        from services.google_search import GoogleSearchService
-        
         # Generate a more varied random seed based on chat, user, and timestamp
         seed_value = (chat_id + update.effective_user.id + timestamp) % 1000
         
@@ -495,12 +512,6 @@ async def convert_to_handwritten(update: Update, context: ContextTypes.DEFAULT_T
     status_message = await update.message.reply_text("✍️ Converting your text to handwritten style... Please wait.")
     
     try:
-        from PIL import Image, ImageDraw, ImageFont
-        import io
-        import random
-        import os
-        import time
-        
         # Create a temporary directory for handwritten images if it doesn't exist
         if not os.path.exists('temp_images'):
             os.makedirs('temp_images')
@@ -615,6 +626,60 @@ async def convert_to_handwritten(update: Update, context: ContextTypes.DEFAULT_T
             "Please try again with a shorter text."
         )
 
+# Funny, creative insult templates for /insult ({target} is the mentioned user)
+_INSULT_TEMPLATES = (
+    "{target} is so boring, sleeping pills take them to fall asleep.",
+    "{target}'s selfies are the reason phones have a self-destruct option.",
+    "{target} is the human version of a participation award.",
+    "{target} is so bad at taking selfies, their phone automatically switches to the settings app.",
+    "I'd roast {target}, but my mom told me not to burn trash because it's bad for the environment.",
+    "{target} has such a way with words... too bad it's the wrong way.",
+    "{target} is proof that evolution can go in reverse.",
+    "If {target} was a spice, they'd be flour.",
+    "{target} is like a cloud - when they disappear, it's a beautiful day.",
+    "{target}'s cooking is the reason doorbells were invented.",
+    "{target} is so out of shape, they get tired walking to the refrigerator.",
+    "{target} is the reason why shampoo has instructions.",
+    "{target} is like a broken calculator - they can't even count on themselves.",
+    "{target} is the type to get lost in a grocery store and call for help.",
+    "{target} is so lazy, they have a remote control for their remote control.",
+    "{target} has a face only a mother could love... from a distance.",
+    "{target} thinks 'getting some fresh air' means opening the refrigerator.",
+    "{target} has a perfect face for radio and a perfect voice for silent films.",
+    "{target} has such a unique fashion sense - it's like they got dressed in the dark... during an earthquake.",
+    "If brains were dynamite, {target} wouldn't have enough to blow their nose.",
+    "{target} is as useful as a screen door on a submarine.",
+    "{target} is so old, their memory is in black and white.",
+    "{target} is so slow, they take 2 hours to watch 60 Minutes.",
+    "{target} is the reason why aliens won't talk to us.",
+    "{target} has delusions of adequacy.",
+    "{target} is living proof that nature sometimes makes mistakes.",
+    "{target} has all the charm and charisma of a dead fish.",
+    "{target}'s room is so dirty, they need a tetanus shot just to make their bed.",
+    "{target} is so predictable, fortune tellers charge them half price.",
+    "{target} is like a broken pencil - pointless.",
+    "{target} is so uninteresting, their imaginary friends ghosted them.",
+    "{target} dances like they're being electrocuted.",
+    "{target} sings like they're gargling mouthwash.",
+    "{target} has the fashion sense of a colorblind scarecrow.",
+    "{target} types with just their index fingers.",
+    "{target} eats pizza with a fork and knife.",
+    "{target} still uses Internet Explorer... by choice.",
+    "{target} couldn't pour water out of a boot if the instructions were on the heel.",
+    "{target} has fewer followers than a broken compass.",
+    "{target} is as deep as a parking lot puddle.",
+    "{target} dresses like they got their clothes from a dumpster behind a clown college.",
+    "{target} is so basic, they make plain yogurt look spicy.",
+    "{target} has the coordination of a newborn giraffe on an ice rink.",
+    "{target} has the charm of a mosquito at a blood bank.",
+    "{target} looks like they were drawn by a 5-year-old using their non-dominant hand.",
+    "{target} is about as useful as a chocolate teapot.",
+    "{target} has a face that would make an onion cry.",
+    "{target} has the personality of unseasoned boiled chicken.",
+    "{target} is like elevator music - annoying and forgettable.",
+    "{target} has all the appeal of a gas station bathroom.",
+)
+
 async def insult_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Generate a humorous insult for a specified user"""
     if not context.args:
@@ -633,66 +698,170 @@ async def insult_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if not target.startswith('@'):
         target = '@' + target
         
-    # List of funny, creative insults
-    insults = [
-        f"{target} is so boring, sleeping pills take them to fall asleep.",
-        f"{target}'s selfies are the reason phones have a self-destruct option.",
-        f"{target} is the human version of a participation award.",
-        f"{target} is so bad at taking selfies, their phone automatically switches to the settings app.",
-        f"I'd roast {target}, but my mom told me not to burn trash because it's bad for the environment.",
-        f"{target} has such a way with words... too bad it's the wrong way.",
-        f"{target} is proof that evolution can go in reverse.",
-        f"If {target} was a spice, they'd be flour.",
-        f"{target} is like a cloud - when they disappear, it's a beautiful day.",
-        f"{target}'s cooking is the reason doorbells were invented.",
-        f"{target} is so out of shape, they get tired walking to the refrigerator.",
-        f"{target} is the reason why shampoo has instructions.",
-        f"{target} is like a broken calculator - they can't even count on themselves.",
-        f"{target} is the type to get lost in a grocery store and call for help.",
-        f"{target} is so lazy, they have a remote control for their remote control.",
-        f"{target} has a face only a mother could love... from a distance.",
-        f"{target} thinks 'getting some fresh air' means opening the refrigerator.",
-        f"{target} has a perfect face for radio and a perfect voice for silent films.",
-        f"{target} has such a unique fashion sense - it's like they got dressed in the dark... during an earthquake.",
-        f"If brains were dynamite, {target} wouldn't have enough to blow their nose.",
-        f"{target} is as useful as a screen door on a submarine.",
-        f"{target} is so old, their memory is in black and white.",
-        f"{target} is so slow, they take 2 hours to watch 60 Minutes.",
-        f"{target} is the reason why aliens won't talk to us.",
-        f"{target} has delusions of adequacy.",
-        f"{target} is living proof that nature sometimes makes mistakes.",
-        f"{target} has all the charm and charisma of a dead fish.",
-        f"{target}'s room is so dirty, they need a tetanus shot just to make their bed.",
-        f"{target} is so predictable, fortune tellers charge them half price.",
-        f"{target} is like a broken pencil - pointless.",
-        f"{target} is so uninteresting, their imaginary friends ghosted them.",
-        f"{target} dances like they're being electrocuted.",
-        f"{target} sings like they're gargling mouthwash.",
-        f"{target} has the fashion sense of a colorblind scarecrow.",
-        f"{target} types with just their index fingers.",
-        f"{target} eats pizza with a fork and knife.",
-        f"{target} still uses Internet Explorer... by choice.",
-        f"{target} couldn't pour water out of a boot if the instructions were on the heel.",
-        f"{target} has fewer followers than a broken compass.",
-        f"{target} is as deep as a parking lot puddle.",
-        f"{target} dresses like they got their clothes from a dumpster behind a clown college.",
-        f"{target} is so basic, they make plain yogurt look spicy.",
-        f"{target} has the coordination of a newborn giraffe on an ice rink.",
-        f"{target} has the charm of a mosquito at a blood bank.",
-        f"{target} looks like they were drawn by a 5-year-old using their non-dominant hand.",
-        f"{target} is about as useful as a chocolate teapot.",
-        f"{target} has a face that would make an onion cry.",
-        f"{target} has the personality of unseasoned boiled chicken.",
-        f"{target} is like elevator music - annoying and forgettable.",
-        f"{target} has all the appeal of a gas station bathroom."
-    ]
     
     # Select a random insult
-    import random
-    insult = random.choice(insults)
+    insult = random.choice(_INSULT_TEMPLATES).format(target=target)
     
     # Send just the insult with no extra text
-    await update.message.reply_text(f"{insult}")
+    await update.message.reply_text(insult)
+
+def _list_slide_files(directory: str) -> List[Tuple[str, str]]:
+    """List (path, extension) pairs for the sendable files of a slide post, sorted by name."""
+    media_files = []
+    with os.scandir(directory) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            # Skip non-media files by name first, so they never cost a stat call
+            name = entry.name
+            dot = name.rfind('.')
+            file_ext = name[dot:].lower() if dot > 0 else ''
+            if file_ext == '.json' or entry.is_dir(follow_symlinks=False):
+                continue
+            
+            if entry.stat().st_size > MAX_FILE_SIZE:
+                continue  # Skip files Telegram won't accept
+            
+            media_files.append((entry.path, file_ext))
+    return media_files
+
+def _remove_tree_in_background(path: str) -> None:
+    """Delete a download directory in a worker thread without waiting for it."""
+    task = asyncio.create_task(asyncio.to_thread(shutil.rmtree, path, ignore_errors=True))
+    # Keep a reference until done so the task isn't garbage collected mid-run
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+async def _safe_delete(message) -> None:
+    """Delete a status message, ignoring messages that are already gone."""
+    try:
+        await message.delete()
+    except Exception:
+        pass
+
+@functools.lru_cache(maxsize=1024)
+def _extract_audio_markup(platform: str, url: str) -> InlineKeyboardMarkup:
+    """Return the "Extract Audio" keyboard for a URL, reused when a link is shared repeatedly."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("🎵 Extract Audio", callback_data=f"extract_sm_audio:{platform}:{url}")]
+    ])
+
+async def _read_file(file_path: str) -> bytes:
+    """Read a file without blocking the event loop."""
+    async with aiofiles.open(file_path, "rb") as f:
+        return await f.read()
+
+async def _send_media_file(bot, chat_id: int, file_path: str, caption: str, reply_markup=None) -> None:
+    """Send a downloaded media file as a photo, video or document based on its extension."""
+    file_ext = os.path.splitext(file_path)[1].lower()
+    file_data = await _read_file(file_path)
+    file_name = os.path.basename(file_path)
+    
+    if file_ext in _IMG_EXT:
+        # Send as photo
+        await bot.send_photo(
+            chat_id=chat_id,
+            photo=file_data,
+            filename=file_name,
+            caption=caption,
+            reply_markup=reply_markup
+        )
+    elif file_ext in _VID_EXT:
+        # Send as video
+        await bot.send_video(
+            chat_id=chat_id,
+            video=file_data,
+            filename=file_name,
+            caption=caption,
+            supports_streaming=True,
+            reply_markup=reply_markup
+        )
+    else:
+        # Send as document
+        await bot.send_document(
+            chat_id=chat_id,
+            document=file_data,
+            filename=file_name,
+            caption=caption,
+            reply_markup=reply_markup
+        )
+
+async def _send_slides_individually(bot, chat_id: int, slides: List[Tuple[int, str, str, Any]]) -> None:
+    """
+    Upload (index, file_path, caption, reply_markup) slides one message each.
+    
+    Uploads run concurrently, _SLIDE_UPLOAD_CONCURRENCY at a time, and a
+    slide hitting Telegram's flood control is retried after the requested wait.
+    """
+    upload_slots = asyncio.Semaphore(_SLIDE_UPLOAD_CONCURRENCY)
+    
+    async def send_single(file_path: str, caption: str, reply_markup) -> None:
+        async with upload_slots:
+            for attempt in range(_SLIDE_UPLOAD_ATTEMPTS):
+                try:
+                    await _send_media_file(bot, chat_id, file_path, caption, reply_markup)
+                    return
+                except RetryAfter as e:
+                    if attempt == _SLIDE_UPLOAD_ATTEMPTS - 1:
+                        raise
+                    delay = e.retry_after
+                    if isinstance(delay, timedelta):
+                        delay = delay.total_seconds()
+                    await asyncio.sleep(delay)
+    
+    results = await asyncio.gather(
+        *(send_single(file_path, caption, reply_markup) for _, file_path, caption, reply_markup in slides),
+        return_exceptions=True
+    )
+    for (i, *_), outcome in zip(slides, results):
+        if isinstance(outcome, Exception):
+            # Other slides are still sent even if one fails
+            logger.error(f"Error sending slide {i+1}: {outcome}")
+
+async def _send_slides(bot, chat_id: int, media_files: List[Tuple[str, str]], reply_markup) -> None:
+    """
+    Send up to 10 slide files as a single album, then the extract audio button.
+    
+    Photos and videos go out in one sendMediaGroup call. Other files, or
+    everything if Telegram rejects the album, are sent one by one,
+    a few at a time.
+    """
+    # Captions count only the slides that are actually sent
+    media_files = media_files[:10]
+    total = len(media_files)
+    slides = [
+        (i, file_path, f"TikTok Slide {i+1}/{total}", file_ext)
+        for i, (file_path, file_ext) in enumerate(media_files)
+    ]
+    if not slides:
+        return
+    album = [slide for slide in slides if slide[3] in _IMG_EXT or slide[3] in _VID_EXT]
+    singles = [slide for slide in slides if slide not in album]
+    
+    if len(album) >= 2:
+        try:
+            contents = await asyncio.gather(*(_read_file(slide[1]) for slide in album))
+            media = [
+                InputMediaPhoto(data, caption=caption, filename=os.path.basename(file_path))
+                if ext in _IMG_EXT else
+                InputMediaVideo(data, caption=caption, filename=os.path.basename(file_path), supports_streaming=True)
+                for (i, file_path, caption, ext), data in zip(album, contents)
+            ]
+            await bot.send_media_group(chat_id=chat_id, media=media)
+        except Exception as e:
+            logger.error(f"Error sending slide album, sending slides individually: {e}")
+            singles = slides
+    else:
+        singles = slides
+    
+    await _send_slides_individually(
+        bot, chat_id, [(i, file_path, caption, None) for i, file_path, caption, _ in singles]
+    )
+    
+    # Albums can't carry inline keyboards, so the button gets its own message
+    await bot.send_message(
+        chat_id=chat_id,
+        text="🎵 Want the audio from these slides?",
+        reply_markup=reply_markup
+    )
 
 async def tiktok_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Download TikTok video without watermark"""
@@ -709,17 +878,12 @@ async def tiktok_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     status_message = await update.message.reply_text("⏳ *Processing TikTok Video*\n\nDownloading and removing watermark...", parse_mode="Markdown")
 
     try:
-        from services.social_media_service import SocialMediaService
-        
         # Process TikTok URL
         platform = SocialMediaService.identify_platform(url)
         
         if platform != 'tiktok':
             # Delete the status message
-            try:
-                await status_message.delete()
-            except Exception:
-                pass
+            await _safe_delete(status_message)
                 
             await update.message.reply_markdown(
                 "❌ *Invalid Link*\n\n"
@@ -733,10 +897,7 @@ async def tiktok_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         
         if not result or error:
             # Delete the status message
-            try:
-                await status_message.delete()
-            except Exception:
-                pass
+            await _safe_delete(status_message)
                 
             await update.message.reply_markdown(
                 f"❌ *Download Failed*\n\n"
@@ -746,92 +907,30 @@ async def tiktok_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             return
             
         # Check if result is a directory (for TikTok slide posts)
-        if os.path.isdir(result):
+        if await aiofiles.os.path.isdir(result):
             # This is a slide post with multiple media files
             await status_message.edit_text("✅ Downloaded TikTok slides. Sending them now...")
             
             # Get all files in the directory
-            media_files = []
-            for filename in sorted(os.listdir(result)):
-                file_path = os.path.join(result, filename)
-                
-                # Skip non-media files and files that are too large
-                if os.path.isdir(file_path) or filename.endswith('.json'):
-                    continue
-                
-                file_size = os.path.getsize(file_path)
-                if file_size > 50 * 1024 * 1024:  # 50MB limit for Telegram
-                    continue  # Skip files that are too large
-                
-                media_files.append(file_path)
+            media_files = await asyncio.to_thread(_list_slide_files, result)
             
-            # Send all media files (up to 10)
-            for i, file_path in enumerate(media_files[:10]):
-                file_ext = os.path.splitext(file_path)[1].lower()
-                
-                try:
-                    # Add extract audio button for the first slide
-                    caption = f"TikTok Slide {i+1}/{len(media_files)}"
-                    reply_markup = None
-                    
-                    if i == 0:  # Only add button to the first slide
-                        keyboard = [
-                            [InlineKeyboardButton("🎵 Extract Audio", callback_data=f"extract_sm_audio:tiktok:{url}")]
-                        ]
-                        reply_markup = InlineKeyboardMarkup(keyboard)
-                    
-                    if file_ext in ['.jpg', '.jpeg', '.png', '.webp']:
-                        # Send as photo
-                        with open(file_path, "rb") as photo_file:
-                            await context.bot.send_photo(
-                                chat_id=update.message.chat_id,
-                                photo=photo_file,
-                                caption=caption,
-                                reply_markup=reply_markup
-                            )
-                    elif file_ext in ['.mp4', '.avi', '.mkv', '.mov']:
-                        # Send as video
-                        with open(file_path, "rb") as video_file:
-                            await context.bot.send_video(
-                                chat_id=update.message.chat_id,
-                                video=video_file,
-                                caption=caption,
-                                supports_streaming=True,
-                                reply_markup=reply_markup
-                            )
-                    else:
-                        # Send as document
-                        with open(file_path, "rb") as doc_file:
-                            await context.bot.send_document(
-                                chat_id=update.message.chat_id,
-                                document=doc_file,
-                                caption=caption,
-                                reply_markup=reply_markup
-                            )
-                except Exception as e:
-                    logger.error(f"Error sending slide {i+1}: {e}")
-                    continue  # Continue with next file even if one fails
+            # Send all media files (up to 10) as an album
+            audio_markup = _extract_audio_markup("tiktok", url)
+            await _send_slides(context.bot, update.message.chat_id, media_files, audio_markup)
             
             # Delete the status message
-            try:
-                await status_message.delete()
-            except Exception:
-                pass
+            await _safe_delete(status_message)
             
-            # Clean up the directory
-            import shutil
-            shutil.rmtree(result)
+            # Clean up the directory once the handler has returned
+            _remove_tree_in_background(result)
             
         else:
             # Regular single video file
             # Check file size
-            file_size = os.path.getsize(result)
+            file_size = await aiofiles.os.path.getsize(result)
             if file_size > 50 * 1024 * 1024:  # 50MB limit for Telegram
                 # Delete the status message
-                try:
-                    await status_message.delete()
-                except Exception:
-                    pass
+                await _safe_delete(status_message)
                     
                 await update.message.reply_markdown(
                     f"❌ *File Too Large*\n\n"
@@ -839,42 +938,37 @@ async def tiktok_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     f"Maximum allowed size is 50 MB."
                 )
                 # Clean up the file
-                os.remove(result)
+                await aiofiles.os.remove(result)
                 return
             
             # Add extract audio button
-            keyboard = [
-                [InlineKeyboardButton("🎵 Extract Audio", callback_data=f"extract_sm_audio:tiktok:{url}")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = _extract_audio_markup("tiktok", url)
             
-            # Delete the status message
-            try:
-                await status_message.delete()
-            except Exception:
-                pass
+            # Delete the status message while the video is read and uploaded
+            status_delete = asyncio.create_task(_safe_delete(status_message))
             
             # Send the video file directly
-            with open(result, "rb") as video_file:
-                await context.bot.send_video(
-                    chat_id=update.message.chat_id,
-                    video=video_file,
-                    caption="Here's your TikTok video!",
-                    supports_streaming=True,
-                    reply_markup=reply_markup
-                )
+            await context.bot.send_video(
+                chat_id=update.message.chat_id,
+                video=await _read_file(result),
+                filename=os.path.basename(result),
+                caption="Here's your TikTok video!",
+                supports_streaming=True,
+                reply_markup=reply_markup
+            )
             
-            # Clean up the file after sending
-            os.remove(result)
+            # Clean up the file after sending; a failed delete is ignored
+            await asyncio.gather(
+                aiofiles.os.remove(result),
+                status_delete,
+                return_exceptions=True
+            )
 
     except Exception as e:
         logger.error(f"Error processing TikTok URL: {str(e)}")
         
         # Delete the status message
-        try:
-            await status_message.delete()
-        except Exception:
-            pass
+        await _safe_delete(status_message)
             
         await update.message.reply_markdown(
             "❌ *Error*\n\n"
@@ -898,17 +992,12 @@ async def instagram_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     status_message = await update.message.reply_text("⏳ *Processing Instagram Content*\n\nExtracting media information...", parse_mode="Markdown")
 
     try:
-        from services.social_media_service import SocialMediaService
-        
         # Process Instagram URL
         platform = SocialMediaService.identify_platform(url)
         
         if platform != 'instagram':
             # Delete the status message
-            try:
-                await status_message.delete()
-            except Exception:
-                pass
+            await _safe_delete(status_message)
                 
             await update.message.reply_markdown(
                 "❌ *Invalid Link*\n\n"
@@ -918,8 +1007,6 @@ async def instagram_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             return
             
         # Create a message with options to download video or audio
-        # Inline keyboard imports moved to top of file
-        
         keyboard = [
             [InlineKeyboardButton("📥 Download Video", callback_data=f"download_sm_video:instagram:{url}")],
             [InlineKeyboardButton("🎵 Extract Audio", callback_data=f"extract_sm_audio:instagram:{url}")]
@@ -927,10 +1014,7 @@ async def instagram_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         reply_markup = InlineKeyboardMarkup(keyboard)
         
         # Delete the status message
-        try:
-            await status_message.delete()
-        except Exception:
-            pass
+        await _safe_delete(status_message)
             
         await update.message.reply_markdown(
             "📱 *Instagram Content Detected*\n\n"
@@ -942,10 +1026,7 @@ async def instagram_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         logger.error(f"Error processing Instagram URL: {str(e)}")
         
         # Delete the status message
-        try:
-            await status_message.delete()
-        except Exception:
-            pass
+        await _safe_delete(status_message)
             
         await update.message.reply_markdown(
             "❌ *Error*\n\n"
@@ -956,8 +1037,6 @@ async def instagram_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def calculate_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Calculate the result of a mathematical expression"""
-    import re
-    
     if not context.args:
         await update.message.reply_markdown(
             "🧮 *Calculator*\n\n"
@@ -975,103 +1054,126 @@ async def calculate_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     else:
         await update.message.reply_text("❌ Invalid math expression. Please check your syntax.")
 
+# Functions and constants allowed in calculator expressions
+_SAFE_FUNCS = {
+    'abs': abs, 'round': round,
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
+    'asin': math.asin, 'acos': math.acos, 'atan': math.atan,
+    'sqrt': math.sqrt, 'log': math.log, 'log10': math.log10,
+}
+_SAFE_CONSTS = {'pi': math.pi, 'e': math.e}
+
+# Supported arithmetic operators, keyed by AST node type
+_BIN_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub,
+    ast.Mult: operator.mul, ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+# Keywords rejected outright in a calculator expression
+_UNSAFE_RE = re.compile(r'import|eval|exec|compile|globals|locals|getattr|setattr|delattr|__')
+
+# Characters allowed in a calculator expression
+_SAFE_EXPR_RE = re.compile(r'^[0-9.+\-*/()^\s%]*$')
+
+# Largest power result accepted, in bits (about 4,200 digits, under Python's
+# int-to-str limit), so nested powers like "(9**10000)**1000" can't stall the event loop
+_MAX_POW_BITS = 14000
+
+@functools.lru_cache(maxsize=512)
+def _parse_expression(expression: str) -> ast.Expression:
+    """Parse (and cache) a calculator expression."""
+    return ast.parse(expression, mode='eval')
+
+def _eval_node(node):
+    """Evaluate a parsed calculator expression, allowing only arithmetic."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        # Estimate the result size from the base's bits; abs() covers negative bases
+        if (isinstance(node.op, ast.Pow)
+                and abs(right) * max(1, int(abs(left)).bit_length()) > _MAX_POW_BITS):
+            raise ValueError("Power result too large")
+        return _BIN_OPS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, ast.Name) and node.id in _SAFE_CONSTS:
+        return _SAFE_CONSTS[node.id]
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id in _SAFE_FUNCS and not node.keywords):
+        return _SAFE_FUNCS[node.func.id](*(_eval_node(arg) for arg in node.args))
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
 def calculate_expression(expression):
     """Calculate the result of a mathematical expression."""
     try:
         # Replace ^ with ** for exponentiation
         expression = expression.replace('^', '**')
         
-        # Use safer eval by creating a local dict with only math functions
-        import math
-        import operator
-        from decimal import Decimal
-        
-        # Define allowed functions and operators
-        safe_dict = {
-            'abs': abs, 'round': round,
-            'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
-            'asin': math.asin, 'acos': math.acos, 'atan': math.atan,
-            'sqrt': math.sqrt, 'log': math.log, 'log10': math.log10,
-            'pi': math.pi, 'e': math.e,
-            'Decimal': Decimal
-        }
-        
-        # Add basic operators
-        safe_dict.update({k: getattr(operator, k) for k in [
-            'add', 'sub', 'mul', 'truediv', 'pow', 'mod', 'floordiv'
-        ]})
-        
         # Check for unsafe constructs
-        if any(keyword in expression for keyword in [
-            'import', 'eval', 'exec', 'compile', 'globals', 'locals',
-            'getattr', 'setattr', 'delattr', '__'
-        ]):
+        if _UNSAFE_RE.search(expression):
             return None
         
-        # Convert the expression to use safer functions
-        sanitized_expr = expression
-        sanitized_expr = sanitized_expr.replace('+', 'add(')
-        sanitized_expr = sanitized_expr.replace('-', 'sub(')
-        sanitized_expr = sanitized_expr.replace('*', 'mul(')
-        sanitized_expr = sanitized_expr.replace('/', 'truediv(')
-        sanitized_expr = sanitized_expr.replace('%', 'mod(')
-        sanitized_expr = sanitized_expr.replace('//', 'floordiv(')
-        
-        # Unfortunately, this approach gets complex with nested expressions
-        # So let's use direct eval with some safeguards
-        
         # Simple security check: only allow specific characters
-        if not re.match(r'^[0-9\.\+\-\*\/\(\)\^\s%]*$', expression):
+        if not _SAFE_EXPR_RE.match(expression):
             return None
             
-        result = eval(expression)
-        return result
+        tree = _parse_expression(expression)
+        return _eval_node(tree.body)
         
     except Exception as e:
         logger.error(f"Error calculating expression: {str(e)}")
         return None
 
-async def langs_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """
-    Show a list of supported languages for translation.
-    Format: /langs
-    """
-    from services.translate_service import TranslationService
-    
+@functools.lru_cache(maxsize=1)
+def _build_langs_message() -> Tuple[str, ...]:
+    """Render the /langs message once, split into Telegram-sized parts."""
     # Get supported languages
     languages = TranslationService.get_supported_languages()
     
     # Format the message with languages in columns
-    formatted_langs = []
-    for code, name in sorted(languages.items(), key=lambda x: x[1]):
-        formatted_langs.append(f"• {name.title()} (`{code}`)")
+    formatted_langs = [
+        f"• {name.title()} (`{code}`)"
+        for code, name in sorted(languages.items(), key=lambda x: x[1])
+    ]
     
     # Split into chunks for better readability
     chunk_size = 20
     chunks = [formatted_langs[i:i + chunk_size] for i in range(0, len(formatted_langs), chunk_size)]
     
     # Create message text with all languages
-    message_text = "🌐 *Supported Translation Languages*\n\n"
+    parts = ["🌐 *Supported Translation Languages*\n\n"]
     
     for i, chunk in enumerate(chunks, 1):
-        message_text += f"*Page {i}/{len(chunks)}*\n"
-        message_text += "\n".join(chunk[:chunk_size]) + "\n\n"
+        parts.append(f"*Page {i}/{len(chunks)}*\n")
+        parts.append("\n".join(chunk))
+        parts.append("\n\n")
     
     # Add usage examples
-    message_text += "*Usage Examples:*\n"
-    message_text += "• `/tl Hello world` - Auto-detect and translate to English\n"
-    message_text += "• `/tl ja Hello world` - Translate to Japanese\n"
-    message_text += "• `/tl fr//en Bonjour` - Translate from French to English\n"
-    message_text += "• Reply to a message with `/tl` to translate it to English\n"
+    parts.append(
+        "*Usage Examples:*\n"
+        "• `/tl Hello world` - Auto-detect and translate to English\n"
+        "• `/tl ja Hello world` - Translate to Japanese\n"
+        "• `/tl fr//en Bonjour` - Translate from French to English\n"
+        "• Reply to a message with `/tl` to translate it to English\n"
+    )
+    message_text = "".join(parts)
     
-    # Send the message in chunks if it's too long
+    # Split the message into chunks if it's too long
     max_length = 4000
-    if len(message_text) > max_length:
-        text_parts = [message_text[i:i + max_length] for i in range(0, len(message_text), max_length)]
-        for part in text_parts:
-            await update.message.reply_markdown(part)
-    else:
-        await update.message.reply_markdown(message_text)
+    return tuple(message_text[i:i + max_length] for i in range(0, len(message_text), max_length))
+
+async def langs_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Show a list of supported languages for translation.
+    Format: /langs
+    """
+    for part in _build_langs_message():
+        await update.message.reply_markdown(part)
 
 async def translate_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
@@ -1202,6 +1304,20 @@ async def show_translation_help(update: Update) -> None:
         parse_mode="Markdown"
     )
 
+async def _get_translate_session() -> aiohttp.ClientSession:
+    """Return the shared translation HTTP session, creating it on first use."""
+    global _TRANSLATE_SESSION
+    if _TRANSLATE_SESSION is None or _TRANSLATE_SESSION.closed:
+        _TRANSLATE_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+        )
+    return _TRANSLATE_SESSION
+
 async def translate_text(text: str, target_lang: str = 'en', source_lang: str = 'auto') -> str:
     """
     Simple function to translate text using Google Translate API.
@@ -1214,37 +1330,39 @@ async def translate_text(text: str, target_lang: str = 'en', source_lang: str =
     Returns:
         The translated text
     """
-    import urllib.parse
-    import aiohttp
-    import json
+    cache_key = (text, target_lang, source_lang)
+    cached = _TRANSLATION_CACHE.get(cache_key)
+    if cached is not None:
+        _TRANSLATION_CACHE.move_to_end(cache_key)
+        return cached
     
     try:
         # Use Google Translate's API to translate text
-        async with aiohttp.ClientSession() as session:
-            url = "https://translate.googleapis.com/translate_a/single"
-            params = {
-                "client": "gtx",
-                "dt": "t",
-                "sl": source_lang,
-                "tl": target_lang,
-                "q": text
-            }
+        session = await _get_translate_session()
+        url = "https://translate.googleapis.com/translate_a/single"
+        params = {
+            "client": "gtx",
+            "dt": "t",
+            "sl": source_lang,
+            "tl": target_lang,
+            "q": text
+        }
+        
+        async with session.get(url, params=params, timeout=_TRANSLATE_TIMEOUT) as response:
+            if response.status != 200:
+                logger.error(f"Translation failed: {response.status}")
+                raise Exception(f"Translation service returned status code {response.status}")
             
-            full_url = f"{url}?{urllib.parse.urlencode(params)}"
-            async with session.get(full_url) as response:
-                if response.status != 200:
-                    logger.error(f"Translation failed: {response.status}")
-                    raise Exception(f"Translation service returned status code {response.status}")
-                
-                data = await response.json(content_type=None)
-                translated_parts = []
-                
-                # Extract translated text from the data structure
-                for part in data[0]:
-                    if part[0]:
-                        translated_parts.append(part[0])
-                
-                return ''.join(translated_parts)
+            data = orjson.loads(await response.read())
+            
+            # Extract translated text from the data structure
+            translated = ''.join(part[0] for part in data[0] if part and part[0])
+        
+        # Remember the result, evicting the least recently used entry
+        _TRANSLATION_CACHE[cache_key] = translated
+        if len(_TRANSLATION_CACHE) > _TRANSLATION_CACHE_SIZE:
+            _TRANSLATION_CACHE.popitem(last=False)
+        return translated
                 
     except Exception as e:
         logger.error(f"Translation error: {e}")
@@ -1259,25 +1377,38 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         user_id = update.effective_user.id
         user_message = update.message.text
         chat_type = update.message.chat.type
-        bot_username = context.bot.username
+        # Lowercased "@username" and its pattern are cached in post_init
+        mention = context.application.bot_data['mention']
+        
+        # Skip group messages unless the bot is mentioned or replied to, before
+        # any URL or math parsing; players of an active number game can still
+        # send a bare number as a guess
+        is_guess = user_id in game_states and user_message.strip().isdigit()
+        if chat_type in ['group', 'supergroup'] and not is_guess:
+            reply = update.message.reply_to_message
+            is_reply_to_bot = reply is not None and reply.from_user is not None and reply.from_user.id == context.bot.id
+            
+            if not (is_reply_to_bot or context.application.bot_data['mention_re'].search(user_message)):
+                return
         
         # Check if it's a math expression (when bot is mentioned)
         is_mentioned = False
         if chat_type != "private":
             if update.message.entities:
+                tag_len = len(mention)
+                lowered = user_message.lower()
                 for entity in update.message.entities:
-                    if entity.type == "mention" and user_message[entity.offset:entity.offset+entity.length] == f"@{bot_username}":
+                    if (entity.type == "mention" and entity.length == tag_len
+                            and lowered.startswith(mention, entity.offset)):
                         is_mentioned = True
                         break
         else:
             is_mentioned = True
             
-        if is_mentioned:
+        # Only run the math regex if the text contains an operator at all
+        if is_mentioned and not _MATH_OPERATORS.isdisjoint(user_message):
             # Look for math expression patterns
-            # Simple pattern: numbers and math operators
-            import re  # Explicitly import re within this function scope
-            expression_pattern = r'[-+]?[0-9]*\.?[0-9]+[\+\-\*\/\^%][0-9\+\-\*\/\^\(\)\.\s%]*'
-            math_pattern = re.search(expression_pattern, user_message)
+            math_pattern = _MATH_EXPR_RE.search(user_message)
             
             if math_pattern:
                 expression = math_pattern.group(0).strip()
@@ -1287,17 +1418,12 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     return
         
         # First, check if this is a URL we can process
-        from handlers.message_handlers import process_youtube_url, process_social_media_url
-        from services.social_media_service import SocialMediaService
-        from utils.helpers import is_youtube_url
-        
-        # Check if the message contains a URL
-        import re  # Make sure re is imported here as well
-        urls = re.findall(r'https?://\S+', user_message)
+        # Check if the message contains a URL (skip the regex for plain chat)
+        urls = _URL_RE.findall(user_message) if "://" in user_message else None
         if urls:
             for url in urls:
                 # Check if it's a YouTube URL
-                if is_youtube_url(url):
+                if helpers.is_youtube_url(url):
                     await process_youtube_url(update, context, url)
                     return
                 
@@ -1382,8 +1508,6 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
         # Process URLs (TikTok, Instagram, YouTube)
         if helpers.is_valid_url(user_message):
-            from services.social_media_service import SocialMediaService
-            
             # Check for TikTok and Instagram URLs
             platform = SocialMediaService.identify_platform(user_message)
             if platform == 'tiktok':
@@ -1395,10 +1519,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 
                 if not result or error:
                     # Delete the status message
-                    try:
-                        await status_message.delete()
-                    except Exception:
-                        pass
+                    await _safe_delete(status_message)
                         
                     await update.message.reply_markdown(
                         f"❌ *Download Failed*\n\n"
@@ -1413,87 +1534,25 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     await status_message.edit_text("✅ Downloaded TikTok slides. Sending them now...")
                     
                     # Get all files in the directory
-                    media_files = []
-                    for filename in sorted(os.listdir(result)):
-                        file_path = os.path.join(result, filename)
-                        
-                        # Skip non-media files and files that are too large
-                        if os.path.isdir(file_path) or filename.endswith('.json'):
-                            continue
-                        
-                        file_size = os.path.getsize(file_path)
-                        if file_size > 50 * 1024 * 1024:  # 50MB limit for Telegram
-                            continue  # Skip files that are too large
-                        
-                        media_files.append(file_path)
+                    media_files = await asyncio.to_thread(_list_slide_files, result)
                     
-                    # Send all media files (up to 10)
-                    for i, file_path in enumerate(media_files[:10]):
-                        file_ext = os.path.splitext(file_path)[1].lower()
-                        
-                        try:
-                            # Add extract audio button for the first slide
-                            caption = f"TikTok Slide {i+1}/{len(media_files)}"
-                            reply_markup = None
-                            
-                            if i == 0:  # Only add button to the first slide
-                                keyboard = [
-                                    [InlineKeyboardButton("🎵 Extract Audio", callback_data=f"extract_sm_audio:tiktok:{user_message}")]
-                                ]
-                                reply_markup = InlineKeyboardMarkup(keyboard)
-                            
-                            if file_ext in ['.jpg', '.jpeg', '.png', '.webp']:
-                                # Send as photo
-                                with open(file_path, "rb") as photo_file:
-                                    await context.bot.send_photo(
-                                        chat_id=update.message.chat_id,
-                                        photo=photo_file,
-                                        caption=caption,
-                                        reply_markup=reply_markup
-                                    )
-                            elif file_ext in ['.mp4', '.avi', '.mkv', '.mov']:
-                                # Send as video
-                                with open(file_path, "rb") as video_file:
-                                    await context.bot.send_video(
-                                        chat_id=update.message.chat_id,
-                                        video=video_file,
-                                        caption=caption,
-                                        supports_streaming=True,
-                                        reply_markup=reply_markup
-                                    )
-                            else:
-                                # Send as document
-                                with open(file_path, "rb") as doc_file:
-                                    await context.bot.send_document(
-                                        chat_id=update.message.chat_id,
-                                        document=doc_file,
-                                        caption=caption,
-                                        reply_markup=reply_markup
-                                    )
-                        except Exception as e:
-                            logger.error(f"Error sending slide {i+1}: {e}")
-                            continue  # Continue with next file even if one fails
+                    # Send all media files (up to 10) as an album
+                    audio_markup = _extract_audio_markup("tiktok", user_message)
+                    await _send_slides(context.bot, update.message.chat_id, media_files, audio_markup)
                     
                     # Delete the status message
-                    try:
-                        await status_message.delete()
-                    except Exception:
-                        pass
+                    await _safe_delete(status_message)
                     
-                    # Clean up the directory
-                    import shutil
-                    shutil.rmtree(result)
+                    # Clean up the directory once the handler has returned
+                    _remove_tree_in_background(result)
                     
                 else:
                     # Regular single video file
                     # Check file size
-                    file_size = os.path.getsize(result)
+                    file_size = await aiofiles.os.path.getsize(result)
                     if file_size > 50 * 1024 * 1024:  # 50MB limit for Telegram
                         # Delete the status message
-                        try:
-                            await status_message.delete()
-                        except Exception:
-                            pass
+                        await _safe_delete(status_message)
                             
                         await update.message.reply_markdown(
                             f"❌ *File Too Large*\n\n"
@@ -1501,39 +1560,35 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                             f"Maximum allowed size is 50 MB."
                         )
                         # Clean up the file
-                        os.remove(result)
+                        await asyncio.to_thread(os.remove, result)
                         return
                     
                     # Add extract audio button
-                    keyboard = [
-                        [InlineKeyboardButton("🎵 Extract Audio", callback_data=f"extract_sm_audio:tiktok:{user_message}")]
-                    ]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
+                    reply_markup = _extract_audio_markup("tiktok", user_message)
                     
-                    # Delete the status message
-                    try:
-                        await status_message.delete()
-                    except Exception:
-                        pass
+                    # Delete the status message while the video is read and uploaded
+                    status_delete = asyncio.create_task(_safe_delete(status_message))
                     
                     # Send the video file directly
-                    with open(result, "rb") as video_file:
-                        await context.bot.send_video(
-                            chat_id=update.message.chat_id,
-                            video=video_file,
-                            caption="Here's your TikTok video!",
-                            supports_streaming=True,
-                            reply_markup=reply_markup
-                        )
+                    await context.bot.send_video(
+                        chat_id=update.message.chat_id,
+                        video=await _read_file(result),
+                        filename=os.path.basename(result),
+                        caption="Here's your TikTok video!",
+                        supports_streaming=True,
+                        reply_markup=reply_markup
+                    )
                     
-                    # Clean up the file after sending
-                    os.remove(result)
+                    # Clean up the file after sending; a failed delete is ignored
+                    await asyncio.gather(
+                        asyncio.to_thread(os.remove, result),
+                        status_delete,
+                        return_exceptions=True
+                    )
                 
                 return
             elif platform == 'instagram':
                 # Create a message with options to download video or audio
-                # Inline keyboard imports moved to top of file
-                
                 keyboard = [
                     [InlineKeyboardButton("📥 Download Video", callback_data=f"download_sm_video:instagram:{user_message}")],
                     [InlineKeyboardButton("🎵 Extract Audio", callback_data=f"extract_sm_audio:instagram:{user_message}")]
@@ -1553,20 +1608,6 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 await youtube_command(update, context)
                 return
 
-        # Skip processing for group messages unless bot is mentioned or replied to
-        if chat_type in ['group', 'supergroup']:
-            is_mentioned = False
-            if bot_username:
-                is_mentioned = f"@{bot_username}" in user_message
-
-            is_reply_to_bot = (
-                update.message.reply_to_message and 
-                update.message.reply_to_message.from_user.id == context.bot.id
-            )
-
-            if not (is_mentioned or is_reply_to_bot):
-                return
-
         # Add message to counter
         message_counter.add_message()
 
@@ -1576,18 +1617,21 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
         await context.bot.send_chat_action(chat_id=update.message.chat_id, action='typing')
 
-        async with AIApiClient() as ai_client:
-            ai_response = await ai_client.get_response(conversation_context)
+        # Reuse the long-lived client (and its connection pool) opened in post_init
+        ai_client = context.application.bot_data.get('ai_client')
+        if ai_client is None:
+            raise RuntimeError("AI client is not available")
+        ai_response = await ai_client.get_response(conversation_context)
 
-            if ai_response:
-                conversation_manager.add_message(user_id, "assistant", ai_response)
-                await update.message.reply_text(ai_response)
-            else:
-                error_message = (
-                    "I apologize, but I couldn't generate a response at the moment. "
-                    "Please try again in a few moments."
-                )
-                await update.message.reply_text(error_message)
+        if ai_response:
+            conversation_manager.add_message(user_id, "assistant", ai_response)
+            await update.message.reply_text(ai_response)
+        else:
+            error_message = (
+                "I apologize, but I couldn't generate a response at the moment. "
+                "Please try again in a few moments."
+            )
+            await update.message.reply_text(error_message)
 
     except Exception as e:
         logger.error(f"Error in handle_message: {str(e)}")
@@ -1617,6 +1661,35 @@ async def handle_chat_member_update(update: Update, context: ContextTypes.DEFAUL
     except Exception as e:
         logger.error(f"Error in chat member update handler: {str(e)}")
 
+async def post_init(application: Application) -> None:
+    """Open shared resources once the application is initialized."""
+    # The bot's username never changes at runtime, so build the mention check once
+    mention = f"@{application.bot.username}".lower()
+    application.bot_data['mention'] = mention
+    application.bot_data['mention_re'] = re.compile(re.escape(mention) + r"(?!\w)", re.IGNORECASE)
+    
+    try:
+        application.bot_data['ai_client'] = await AIApiClient().__aenter__()
+    except Exception as e:
+        # handle_message reports the failure to users instead of crashing startup
+        logger.error(f"Could not initialize the AI client: {str(e)}")
+        application.bot_data['ai_client'] = None
+
+async def post_stop(application: Application) -> None:
+    """Flush queued game message edits while the bot can still send them."""
+    await handlers.betting_handlers.shutdown_edit_queue()
+
+async def post_shutdown(application: Application) -> None:
+    """Release shared resources once the application has stopped."""
+    global _TRANSLATE_SESSION
+    ai_client = application.bot_data.pop('ai_client', None)
+    if ai_client is not None:
+        await ai_client.__aexit__(None, None, None)
+    
+    if _TRANSLATE_SESSION is not None and not _TRANSLATE_SESSION.closed:
+        await _TRANSLATE_SESSION.close()
+    _TRANSLATE_SESSION = None
+
 def create_bot():
     """Create and configure the bot with all necessary handlers."""
     # Get the bot token from environment variable
@@ -1624,56 +1697,75 @@ def create_bot():
         raise ValueError("TELEGRAM_BOT_TOKEN environment variable is not set")
     
     # Create the Application
-    application = Application.builder().token(BOT_TOKEN).build()
-    
-    # Add command handlers
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("clear", clear_context))
-    application.add_handler(CommandHandler("context", show_context))
-    application.add_handler(CommandHandler("admins", show_admins))
-    application.add_handler(CommandHandler("total", total_messages_today))
-    application.add_handler(CommandHandler("ttotal", total_messages_year))
-    application.add_handler(CommandHandler("fun", fun_command))
-    application.add_handler(CommandHandler("img", image_search))
-    application.add_handler(CommandHandler("write", convert_to_handwritten))
-    application.add_handler(CommandHandler("tiktok", tiktok_command))
-    application.add_handler(CommandHandler("instagram", instagram_command))
-    application.add_handler(CommandHandler("insult", insult_command))
-    application.add_handler(CommandHandler("calculate", calculate_command))
-    application.add_handler(CommandHandler("tl", translate_command))
-    application.add_handler(CommandHandler("langs", langs_command))
-    
-    # Add new command handlers
-    application.add_handler(CommandHandler("search", search_command))
-    application.add_handler(CommandHandler("scrape", scrape_command))
-    application.add_handler(CommandHandler("wallet", handlers.betting_handlers.wallet_command))
-    application.add_handler(CommandHandler("resetwallet", handlers.betting_handlers.reset_wallet_command))
-    application.add_handler(CommandHandler("bet", handlers.betting_handlers.bet_command))
-    
-    # Add direct game command handlers
-    application.add_handler(CommandHandler("dice", handlers.betting_handlers.dice_command))
-    application.add_handler(CommandHandler("coin", handlers.betting_handlers.coin_command))
-    application.add_handler(CommandHandler("number", handlers.betting_handlers.number_command))
-    application.add_handler(CommandHandler("rps", handlers.betting_handlers.rps_command))
-    
-    # Add admin wallet management commands (only available to admin user ID: 1159603709)
-    application.add_handler(CommandHandler("adminsetbalance", handlers.betting_handlers.admin_set_balance_command))
-    application.add_handler(CommandHandler("adminaddbalance", handlers.betting_handlers.admin_add_balance_command))
-    application.add_handler(CommandHandler("adminremovebalance", handlers.betting_handlers.admin_remove_balance_command))
-    application.add_handler(CommandHandler("adminlistwallets", handlers.betting_handlers.admin_list_wallets_command))
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .post_init(post_init)
+        .post_stop(post_stop)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     
-    # Register crypto betting handlers for integration with @cctip_bot
-    from handlers.crypto_handlers import register_crypto_handlers
-    register_crypto_handlers(application)
+    betting = handlers.betting_handlers
     
-    application.add_handler(CommandHandler("youtube", youtube_command))
-    application.add_handler(CommandHandler("analyze", analyze_command))
+    # General commands
+    commands = (
+        ("start", start_command),
+        ("help", help_command),
+        ("clear", clear_context),
+        ("context", show_context),
+        ("admins", show_admins),
+        ("total", total_messages_today),
+        ("ttotal", total_messages_year),
+        ("fun", fun_command),
+        ("tiktok", tiktok_command),
+        ("instagram", instagram_command),
+        ("insult", insult_command),
+        ("calculate", calculate_command),
+        ("tl", translate_command),
+        ("langs", langs_command),
+        ("search", search_command),
+        ("scrape", scrape_command),
+        ("youtube", youtube_command),
+        ("analyze", analyze_command),
+    )
+    
+    # Slow handlers run as their own tasks so they don't hold up other updates
+    non_blocking_commands = (
+        ("img", image_search),
+        ("write", convert_to_handwritten),
+    )
+    
+    # Wallet, betting and direct game commands
+    betting_commands = (
+        ("wallet", betting.wallet_command),
+        ("resetwallet", betting.reset_wallet_command),
+        ("bet", betting.bet_command),
+        ("dice", betting.dice_command),
+        ("coin", betting.coin_command),
+        ("number", betting.number_command),
+        ("rps", betting.rps_command),
+        # Admin wallet management (only available to admin user ID: 1159603709)
+        ("adminsetbalance", betting.admin_set_balance_command),
+        ("adminaddbalance", betting.admin_add_balance_command),
+        ("adminremovebalance", betting.admin_remove_balance_command),
+        ("adminlistwallets", betting.admin_list_wallets_command),
+    )
+    
+    # Checkers game commands
+    checkers_commands = (
+        ("checkers", checkers_command),
+        ("endcheckers", end_checkers_command),
+        ("move", move_checkers_command),
+    )
     
-    # Add checkers game handlers
-    application.add_handler(CommandHandler("checkers", checkers_command))
-    application.add_handler(CommandHandler("endcheckers", end_checkers_command))
-    application.add_handler(CommandHandler("move", move_checkers_command))
+    for name, callback in commands + betting_commands + checkers_commands:
+        application.add_handler(CommandHandler(name, callback))
+    for name, callback in non_blocking_commands:
+        application.add_handler(CommandHandler(name, callback, block=False))
+    
+    # Register crypto betting handlers for integration with @cctip_bot
+    register_crypto_handlers(application)
     
     # Add photo handler
     application.add_handler(MessageHandler(filters.PHOTO, handle_photo))
@@ -1684,7 +1776,13 @@ def create_bot():
     # Add betting game callback handler
     application.add_handler(CallbackQueryHandler(
         handlers.betting_handlers.handle_betting_callback,
-        pattern=r"^(join_betting_game|betting_game_move|cancel_betting_game|refresh)"
+        pattern=handlers.betting_handlers.CALLBACK_PATTERN
+    ))
+    
+    # Add admin wallet list paging handler
+    application.add_handler(CallbackQueryHandler(
+        handlers.betting_handlers.admin_wallets_page_callback,
+        pattern=f"^{handlers.betting_handlers.BTN_WALLETS_PAGE}:"
     ))
     
     application.add_handler(CallbackQueryHandler(handle_callback))  # Fallback for all other callbacks
@@ -1725,8 +1823,9 @@ async def error_handler(update, context):
     """Log the error and send a message to the user."""
     logger.error(f"Update {update} caused error {context.error}")
     
-    # Only attempt to send message if update object is valid
-    if update and update.effective_chat:
+    # Only attempt to send message if update object is valid (errors raised
+    # outside of update processing arrive with None or a non-Update object)
+    if isinstance(update, Update) and update.effective_chat:
         try:
             await context.bot.send_message(
                 chat_id=update.effective_chat.id, 
@@ -1,11 +1,15 @@
 """
 Checkers game implementation for Telegram Bot.
 """
+import asyncio
+import contextlib
 import random
-from enum import Enum
-from typing import List, Tuple, Dict, Optional, Any
+import re
+import time
+from enum import Enum, IntEnum
+from typing import AsyncIterator, Dict, ItemsView, List, Optional, Tuple, Any
 
-class PieceType(Enum):
+class PieceType(IntEnum):
     EMPTY = 0
     WHITE = 1
     BLACK = 2
@@ -17,13 +21,268 @@ class GameState(Enum):
     WAITING_FOR_MOVE = 1
     GAME_OVER = 2
 
+# Bitboards: bit (row * 8 + col) is one square, row 0 is the top (Black's side)
+FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+DARK_SQUARES = 0x55AA55AA55AA55AA
+NOT_A_FILE = 0xFEFEFEFEFEFEFEFE  # Everything except column A
+NOT_H_FILE = 0x7F7F7F7F7F7F7F7F  # Everything except column H
+RANK_0 = 0x00000000000000FF      # Row 1, where White men are crowned
+RANK_7 = 0xFF00000000000000      # Row 8, where Black men are crowned
+BLACK_START = 0x0000000000AA55AA
+WHITE_START = 0x55AA550000000000
+
+# One diagonal step for every set bit; masks drop pieces that would wrap around an edge
+def _up_left(bb: int) -> int:
+    return (bb >> 9) & NOT_H_FILE
+
+def _up_right(bb: int) -> int:
+    return (bb >> 7) & NOT_A_FILE
+
+def _down_left(bb: int) -> int:
+    return (bb << 7) & NOT_H_FILE & FULL_BOARD
+
+def _down_right(bb: int) -> int:
+    return (bb << 9) & NOT_A_FILE & FULL_BOARD
+
+WHITE_DIRECTIONS = (_up_left, _up_right)
+BLACK_DIRECTIONS = (_down_left, _down_right)
+KING_DIRECTIONS = WHITE_DIRECTIONS + BLACK_DIRECTIONS
+
+# The opposite step, used to walk back from a destination bit to its origin
+_REVERSE = {
+    _up_left: _down_right,
+    _up_right: _down_left,
+    _down_left: _up_right,
+    _down_right: _up_left,
+}
+
+def _build_move_tables(directions) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[Tuple[Tuple[int, int], ...], ...]]:
+    """For every square, list the one-step destinations and the (jumped, landing) pairs that stay on the board."""
+    quiet_moves = []
+    jumps = []
+    for sq in range(64):
+        bb = 1 << sq
+        quiet_moves.append(tuple(step(bb) for step in directions if step(bb)))
+        jumps.append(tuple((step(bb), step(step(bb))) for step in directions if step(step(bb))))
+    return tuple(quiet_moves), tuple(jumps)
+
+# QUIET_MOVES[piece][square] -> destination bits, JUMPS[piece][square] -> (jumped bit, landing bit);
+# plain tuples indexed by the PieceType value (EMPTY has no moves)
+_NO_MOVES = ((),) * 64
+_WHITE_TABLES = _build_move_tables(WHITE_DIRECTIONS)
+_BLACK_TABLES = _build_move_tables(BLACK_DIRECTIONS)
+_KING_TABLES = _build_move_tables(KING_DIRECTIONS)
+QUIET_MOVES = (_NO_MOVES, _WHITE_TABLES[0], _BLACK_TABLES[0], _KING_TABLES[0], _KING_TABLES[0])
+JUMPS = (_NO_MOVES, _WHITE_TABLES[1], _BLACK_TABLES[1], _KING_TABLES[1], _KING_TABLES[1])
+
+# A side's king is its man value plus this (WHITE -> WHITE_KING, BLACK -> BLACK_KING)
+_KING_OFFSET = PieceType.WHITE_KING - PieceType.WHITE
+
+# (row, col) for every single-bit bitboard, built once so move generation
+# doesn't allocate a coordinate tuple per move
+_BIT_COORDS = {1 << sq: (sq >> 3, sq & 7) for sq in range(64)}
+
+# Board display symbols, indexed by PieceType value (empty squares depend on their colour)
+_EMPTY_LIGHT = "⬜"
+_EMPTY_DARK = "⬛"
+_PIECE_SYMBOLS = ("", "⚪", "⚫", "👑⚪", "👑⚫")
+
+# Moves are written like "A1-B2"; spaces are allowed anywhere and letters in either case
+_MOVE_RE = re.compile(r"\s*([A-Ha-h])\s*([1-8])\s*-\s*([A-Ha-h])\s*([1-8])\s*")
+_FILE_INDEX = {letter: i for i, letter in enumerate("ABCDEFGH")}
+_FILE_INDEX.update({letter.lower(): i for letter, i in _FILE_INDEX.items()})
+_RANK_INDEX = {str(i + 1): i for i in range(8)}
+
+# AI search limits: iterative deepening stops at whichever is hit first
+AI_TIME_BUDGET = 0.3  # seconds per AI move
+AI_MAX_DEPTH = 8
+_WIN_SCORE = 1000
+
+# Zobrist keys, ZOBRIST[piece][square], from a fixed seed so they are the same every run
+_zobrist_rng = random.Random(0xC4EC6E25)
+ZOBRIST = tuple(tuple(_zobrist_rng.getrandbits(64) for _ in range(64)) for _ in PieceType)
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)  # Mixed in when White is to move
+
+# Transposition table: (key, depth, score, flag, best move) per slot, replaced by
+# deeper searches; shared by all games since entries depend only on the position
+_TT_SIZE = 1 << 18
+_TT_MASK = _TT_SIZE - 1
+_TT_EXACT, _TT_LOWER, _TT_UPPER = 0, 1, 2
+_TRANSPOSITIONS: List[Optional[Tuple[int, int, int, int, Tuple[int, int, int]]]] = [None] * _TT_SIZE
+
+def _zobrist_key(white: int, black: int, wk: int, bk: int, white_turn: bool) -> int:
+    """Hash a position from scratch; the search then updates it move by move."""
+    key = ZOBRIST_SIDE if white_turn else 0
+    for piece, bb in (
+        (PieceType.WHITE, white & ~wk),
+        (PieceType.BLACK, black & ~bk),
+        (PieceType.WHITE_KING, wk),
+        (PieceType.BLACK_KING, bk),
+    ):
+        keys = ZOBRIST[piece]
+        while bb:
+            bit = bb & -bb
+            bb ^= bit
+            key ^= keys[bit.bit_length() - 1]
+    return key
+
+class _SearchTimeout(Exception):
+    """Raised inside the AI search once its time budget is spent."""
+
+def _search_moves(own: int, enemy: int, own_kings: int, white_turn: bool) -> List[Tuple[int, int, int]]:
+    """
+    List (from_bit, to_bit, jumped_bit) moves for the side to move.
+    Captures are forced here, so only jumps are returned when one exists.
+    """
+    man_directions = WHITE_DIRECTIONS if white_turn else BLACK_DIRECTIONS
+    men = own & ~own_kings
+    empty = DARK_SQUARES & ~(own | enemy)
+    jumps = []
+    quiet_moves = []
+    
+    for step in KING_DIRECTIONS:
+        movers = own_kings | men if step in man_directions else own_kings
+        if not movers:
+            continue
+        back = _REVERSE[step]
+        
+        targets = step(step(movers) & enemy) & empty
+        while targets:
+            to_bb = targets & -targets
+            targets ^= to_bb
+            jumped = back(to_bb)
+            jumps.append((back(jumped), to_bb, jumped))
+        
+        if not jumps:
+            targets = step(movers) & empty
+            while targets:
+                to_bb = targets & -targets
+                targets ^= to_bb
+                quiet_moves.append((back(to_bb), to_bb, 0))
+    
+    return jumps or quiet_moves
+
+def _play(own: int, enemy: int, own_kings: int, enemy_kings: int, white_turn: bool, key: int,
+          from_bb: int, to_bb: int, jumped: int) -> Tuple[int, int, int, int, int, bool]:
+    """
+    Apply a search move and update the Zobrist key (side to move excluded).
+    The last item says whether the same side must keep jumping.
+    """
+    moved = from_bb | to_bb
+    to_sq = to_bb.bit_length() - 1
+    own ^= moved
+    # Same rule as make_move: a piece crowned by this jump continues as a man
+    piece = PieceType.WHITE if white_turn else PieceType.BLACK
+    is_king = own_kings & from_bb
+    if is_king:
+        piece += _KING_OFFSET
+        own_kings ^= moved
+        key ^= ZOBRIST[piece][from_bb.bit_length() - 1] ^ ZOBRIST[piece][to_sq]
+    elif to_bb & (RANK_0 if white_turn else RANK_7):
+        own_kings |= to_bb
+        key ^= ZOBRIST[piece][from_bb.bit_length() - 1] ^ ZOBRIST[piece + _KING_OFFSET][to_sq]
+    else:
+        key ^= ZOBRIST[piece][from_bb.bit_length() - 1] ^ ZOBRIST[piece][to_sq]
+    
+    if not jumped:
+        return own, enemy, own_kings, enemy_kings, key, False
+    
+    enemy_piece = PieceType.BLACK if white_turn else PieceType.WHITE
+    if enemy_kings & jumped:
+        enemy_piece += _KING_OFFSET
+    key ^= ZOBRIST[enemy_piece][jumped.bit_length() - 1]
+    enemy &= ~jumped
+    enemy_kings &= ~jumped
+    
+    empty = DARK_SQUARES & ~(own | enemy)
+    for over, landing in JUMPS[piece][to_sq]:
+        if over & enemy and landing & empty:
+            return own, enemy, own_kings, enemy_kings, key, True
+    return own, enemy, own_kings, enemy_kings, key, False
+
+def _evaluate(own: int, enemy: int, own_kings: int, enemy_kings: int) -> int:
+    """Material balance for the side to move; a king is worth three men."""
+    return (own.bit_count() - enemy.bit_count()) + 2 * (own_kings.bit_count() - enemy_kings.bit_count())
+
+def _negamax(own: int, enemy: int, own_kings: int, enemy_kings: int, white_turn: bool, key: int,
+             depth: int, alpha: int, beta: int, deadline: float) -> int:
+    """Alpha-beta negamax score of a position for the side to move."""
+    if time.monotonic() > deadline:
+        raise _SearchTimeout
+    
+    # Reuse earlier results for this position, and try its best move first
+    slot = key & _TT_MASK
+    entry = _TRANSPOSITIONS[slot]
+    tt_move = None
+    if entry is not None and entry[0] == key:
+        tt_move = entry[4]
+        if entry[1] >= depth:
+            score, flag = entry[2], entry[3]
+            if flag == _TT_EXACT:
+                return score
+            if flag == _TT_LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score
+    
+    moves = _search_moves(own, enemy, own_kings, white_turn)
+    if not moves:
+        # No pieces or no moves loses; losing later is better than losing sooner
+        return -_WIN_SCORE - depth
+    if depth == 0:
+        return _evaluate(own, enemy, own_kings, enemy_kings)
+    if tt_move is not None and tt_move in moves:
+        moves.remove(tt_move)
+        moves.insert(0, tt_move)
+    
+    alpha_start = alpha
+    best = -_WIN_SCORE * 2
+    best_move = moves[0]
+    for move in moves:
+        n_own, n_enemy, n_own_kings, n_enemy_kings, n_key, again = _play(
+            own, enemy, own_kings, enemy_kings, white_turn, key, *move
+        )
+        if again:
+            # Multi-jump: the same side moves again, so the score keeps its sign
+            score = _negamax(n_own, n_enemy, n_own_kings, n_enemy_kings, white_turn, n_key,
+                             depth - 1, alpha, beta, deadline)
+        else:
+            score = -_negamax(n_enemy, n_own, n_enemy_kings, n_own_kings, not white_turn, n_key ^ ZOBRIST_SIDE,
+                              depth - 1, -beta, -alpha, deadline)
+        if score > best:
+            best = score
+            best_move = move
+            if best > alpha:
+                alpha = best
+                if alpha >= beta:
+                    break
+    
+    if best <= alpha_start:
+        flag = _TT_UPPER
+    elif best >= beta:
+        flag = _TT_LOWER
+    else:
+        flag = _TT_EXACT
+    if entry is None or entry[1] <= depth:
+        _TRANSPOSITIONS[slot] = (key, depth, best, flag, best_move)
+    return best
+
 class CheckersGame:
     def __init__(self, user_id1: int, user_id2: Optional[int] = None):
         """
         Initialize a checkers game.
         If user_id2 is None, the opponent is the bot (AI).
         """
-        self.board = self._create_board()
+        # White/black hold all of a side's pieces, wk/bk just its kings
+        self.white = 0
+        self.black = 0
+        self.wk = 0
+        self.bk = 0
+        self._create_board()
+        # get_possible_moves results by include_jumps_only, cleared whenever a move is made
+        self._moves_cache: Dict[bool, List[Tuple[Tuple[int, int], Tuple[int, int]]]] = {}
         self.user_id1 = user_id1  # Player 1 (WHITE)
         self.user_id2 = user_id2  # Player 2 (BLACK) or None for AI
         self.current_turn = PieceType.WHITE  # White goes first
@@ -32,52 +291,41 @@ class CheckersGame:
         self.last_move = None
         self.move_history = []
         
-    def _create_board(self) -> List[List[PieceType]]:
-        """Create the initial checkers board."""
-        board = [[PieceType.EMPTY for _ in range(8)] for _ in range(8)]
-        
-        # Set up black pieces (top of board)
-        for row in range(3):
-            for col in range(8):
-                if (row + col) % 2 == 1:  # Only place on black squares
-                    board[row][col] = PieceType.BLACK
-        
-        # Set up white pieces (bottom of board)
-        for row in range(5, 8):
-            for col in range(8):
-                if (row + col) % 2 == 1:  # Only place on black squares
-                    board[row][col] = PieceType.WHITE
-                    
-        return board
+    def _create_board(self) -> None:
+        """Set up the initial checkers position."""
+        # Black pieces fill the dark squares of the top three rows, white the bottom three
+        self.black = BLACK_START
+        self.white = WHITE_START
+        self.wk = 0
+        self.bk = 0
+    
+    def piece_at(self, row: int, col: int) -> PieceType:
+        """Return the piece on a square."""
+        bit = 1 << (row * 8 + col)
+        if self.white & bit:
+            return PieceType.WHITE_KING if self.wk & bit else PieceType.WHITE
+        if self.black & bit:
+            return PieceType.BLACK_KING if self.bk & bit else PieceType.BLACK
+        return PieceType.EMPTY
     
     def get_board_as_string(self) -> str:
         """Convert the board to a string representation for display."""
-        symbols = {
-            PieceType.EMPTY: "⬛" if True else "⬜",  # Black square if empty
-            PieceType.WHITE: "⚪",
-            PieceType.BLACK: "⚫",
-            PieceType.WHITE_KING: "👑⚪",
-            PieceType.BLACK_KING: "👑⚫"
-        }
-        
         # Add column labels (A-H)
-        result = "  A B C D E F G H\n"
+        parts = ["  A B C D E F G H\n"]
         
-        for row_idx, row in enumerate(self.board):
-            result += f"{row_idx+1} "  # Add row labels (1-8)
+        for row_idx in range(8):
+            parts.append(f"{row_idx+1} ")  # Add row labels (1-8)
             
-            for col_idx, piece in enumerate(row):
-                # Display piece or empty square
-                if piece == PieceType.EMPTY:
-                    # Alternating squares for the board pattern
-                    result += "⬜" if (row_idx + col_idx) % 2 == 0 else "⬛"
-                else:
-                    result += symbols[piece]
-                
-                result += " "
-            result += "\n"
+            for col_idx in range(8):
+                # Display piece or, for empty squares, the alternating board pattern
+                parts.append(
+                    _PIECE_SYMBOLS[self.piece_at(row_idx, col_idx)]
+                    or (_EMPTY_LIGHT if (row_idx + col_idx) % 2 == 0 else _EMPTY_DARK)
+                )
+                parts.append(" ")
+            parts.append("\n")
             
-        return result
+        return "".join(parts)
     
     def get_game_status(self) -> str:
         """Get the current game status as text."""
@@ -109,43 +357,31 @@ class CheckersGame:
         if not (0 <= from_row < 8 and 0 <= from_col < 8 and 0 <= to_row < 8 and 0 <= to_col < 8):
             return False
         
+        from_sq = from_row * 8 + from_col
+        from_bb = 1 << from_sq
+        to_bb = 1 << (to_row * 8 + to_col)
+        if self.current_turn == PieceType.WHITE:
+            own, enemy, kings = self.white, self.black, self.wk
+        else:
+            own, enemy, kings = self.black, self.white, self.bk
+        piece = self.current_turn + _KING_OFFSET if from_bb & kings else self.current_turn
+        
         # Check if from position has the current player's piece
-        piece = self.board[from_row][from_col]
-        if self.current_turn == PieceType.WHITE and piece not in [PieceType.WHITE, PieceType.WHITE_KING]:
-            return False
-        if self.current_turn == PieceType.BLACK and piece not in [PieceType.BLACK, PieceType.BLACK_KING]:
+        if not from_bb & own:
             return False
         
         # Check if to position is empty
-        if self.board[to_row][to_col] != PieceType.EMPTY:
-            return False
-        
-        # Check if to position is a diagonal move
-        if abs(to_row - from_row) != abs(to_col - from_col):
+        if to_bb & (self.white | self.black):
             return False
         
-        # Check movement direction based on piece type (unless it's a king)
-        if piece == PieceType.WHITE and to_row > from_row:
-            return False  # White can only move up
-        if piece == PieceType.BLACK and to_row < from_row:
-            return False  # Black can only move down
-        
-        # Check if it's a regular move (1 square diagonal)
-        if abs(to_row - from_row) == 1:
+        # Regular move (1 square diagonal, men only forward)
+        if to_bb in QUIET_MOVES[piece][from_sq]:
             return True
         
-        # Check if it's a jump (2 squares diagonal)
-        if abs(to_row - from_row) == 2:
-            # Calculate the position of the jumped piece
-            jumped_row = (from_row + to_row) // 2
-            jumped_col = (from_col + to_col) // 2
-            jumped_piece = self.board[jumped_row][jumped_col]
-            
-            # Check if there's an opponent's piece to jump over
-            if self.current_turn == PieceType.WHITE and jumped_piece in [PieceType.BLACK, PieceType.BLACK_KING]:
-                return True
-            if self.current_turn == PieceType.BLACK and jumped_piece in [PieceType.WHITE, PieceType.WHITE_KING]:
-                return True
+        # Jump (2 squares diagonal) over an opponent's piece
+        for jumped, landing in JUMPS[piece][from_sq]:
+            if landing == to_bb:
+                return bool(jumped & enemy)
         
         return False
     
@@ -154,49 +390,70 @@ class CheckersGame:
         Get all possible moves for the current player.
         If include_jumps_only is True, only return moves that involve captures.
         """
+        cached = self._moves_cache.get(include_jumps_only)
+        if cached is not None:
+            return cached
+        
         possible_moves = []
+        jumps = []
+        if self.current_turn == PieceType.WHITE:
+            own, enemy, kings, man_directions = self.white, self.black, self.wk, WHITE_DIRECTIONS
+        else:
+            own, enemy, kings, man_directions = self.black, self.white, self.bk, BLACK_DIRECTIONS
+        men = own & ~kings
+        empty = DARK_SQUARES & ~(self.white | self.black)
         
-        # Look for pieces of the current player's color
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
-                
-                # Check if it's the current player's piece
-                if (self.current_turn == PieceType.WHITE and piece in [PieceType.WHITE, PieceType.WHITE_KING]) or \
-                   (self.current_turn == PieceType.BLACK and piece in [PieceType.BLACK, PieceType.BLACK_KING]):
-                    
-                    # Check all possible move directions
-                    move_directions = []
-                    
-                    # Regular pieces can only move in certain directions
-                    if piece == PieceType.WHITE:
-                        move_directions = [(-1, -1), (-1, 1)]  # Up-left, Up-right
-                    elif piece == PieceType.BLACK:
-                        move_directions = [(1, -1), (1, 1)]  # Down-left, Down-right
-                    else:  # Kings can move in all diagonal directions
-                        move_directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-                    
-                    # Check regular moves (1 square)
-                    if not include_jumps_only:
-                        for dr, dc in move_directions:
-                            new_row, new_col = row + dr, col + dc
-                            if 0 <= new_row < 8 and 0 <= new_col < 8 and self.board[new_row][new_col] == PieceType.EMPTY:
-                                possible_moves.append(((row, col), (new_row, new_col)))
-                    
-                    # Check jump moves (2 squares with a capture)
-                    for dr, dc in move_directions:
-                        new_row, new_col = row + 2*dr, col + 2*dc
-                        jumped_row, jumped_col = row + dr, col + dc
-                        
-                        if 0 <= new_row < 8 and 0 <= new_col < 8 and self.board[new_row][new_col] == PieceType.EMPTY:
-                            jumped_piece = self.board[jumped_row][jumped_col]
-                            
-                            # Check if jumped piece is an opponent's piece
-                            if (self.current_turn == PieceType.WHITE and jumped_piece in [PieceType.BLACK, PieceType.BLACK_KING]) or \
-                               (self.current_turn == PieceType.BLACK and jumped_piece in [PieceType.WHITE, PieceType.WHITE_KING]):
-                                possible_moves.append(((row, col), (new_row, new_col)))
-        
-        return possible_moves
+        # Shift every piece that may move in a direction at once, then only
+        # walk the destination bits that are actually set
+        for step in KING_DIRECTIONS:
+            movers = kings | men if step in man_directions else kings
+            if not movers:
+                continue
+            back = _REVERSE[step]
+            
+            # Regular moves (1 square)
+            if not include_jumps_only:
+                targets = step(movers) & empty
+                while targets:
+                    to_bb = targets & -targets
+                    targets ^= to_bb
+                    possible_moves.append((_BIT_COORDS[back(to_bb)], _BIT_COORDS[to_bb]))
+            
+            # Jump moves (2 squares with a capture)
+            targets = step(step(movers) & enemy) & empty
+            while targets:
+                to_bb = targets & -targets
+                targets ^= to_bb
+                jumps.append((_BIT_COORDS[back(back(to_bb))], _BIT_COORDS[to_bb]))
+        
+        # A full scan also yields the jumps-only list, so cache both
+        self._moves_cache[True] = jumps
+        if not include_jumps_only:
+            possible_moves.extend(jumps)
+            self._moves_cache[False] = possible_moves
+            return possible_moves
+        return jumps
+    
+    def _any_jump(self) -> bool:
+        """Check whether the current player has a capture, without listing the moves."""
+        return self._has_moves(jumps_only=True)
+    
+    def _has_moves(self, jumps_only: bool = False) -> bool:
+        """Check whether the current player can move at all (or capture, with jumps_only)."""
+        if self.current_turn == PieceType.WHITE:
+            own, enemy, kings, man_directions = self.white, self.black, self.wk, WHITE_DIRECTIONS
+        else:
+            own, enemy, kings, man_directions = self.black, self.white, self.bk, BLACK_DIRECTIONS
+        men = own & ~kings
+        empty = DARK_SQUARES & ~(self.white | self.black)
+        
+        for step in KING_DIRECTIONS:
+            movers = kings | men if step in man_directions else kings
+            if step(step(movers) & enemy) & empty:
+                return True
+            if not jumps_only and step(movers) & empty:
+                return True
+        return False
     
     def make_move(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> bool:
         """
@@ -205,28 +462,58 @@ class CheckersGame:
         if not self.is_valid_move(from_pos, to_pos):
             return False
         
+        self._apply_legal_move(from_pos, to_pos)
+        
+        # If it's AI's turn, make the AI move
+        if self.current_turn == PieceType.BLACK and self.user_id2 is None and self.state != GameState.GAME_OVER:
+            self.make_ai_move()
+        
+        return True
+    
+    def _apply_legal_move(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> None:
+        """Play a move already known to be legal, then pass the turn unless a jump can continue."""
+        # The position is about to change, so any generated moves are stale
+        self._moves_cache.clear()
+        
         from_row, from_col = from_pos
         to_row, to_col = to_pos
         
+        from_bb = 1 << (from_row * 8 + from_col)
+        to_bb = 1 << (to_row * 8 + to_col)
+        moved = from_bb | to_bb
+        white_turn = self.current_turn == PieceType.WHITE
+        
         # Move the piece
-        piece = self.board[from_row][from_col]
-        self.board[from_row][from_col] = PieceType.EMPTY
-        self.board[to_row][to_col] = piece
+        if white_turn:
+            self.white ^= moved
+            is_king = bool(self.wk & from_bb)
+            if is_king:
+                self.wk ^= moved
+        else:
+            self.black ^= moved
+            is_king = bool(self.bk & from_bb)
+            if is_king:
+                self.bk ^= moved
         
         # Check if it was a jump (capture)
         captured = False
         if abs(to_row - from_row) == 2:
-            # Remove the jumped piece
-            jumped_row = (from_row + to_row) // 2
-            jumped_col = (from_col + to_col) // 2
-            self.board[jumped_row][jumped_col] = PieceType.EMPTY
+            # Remove the jumped piece, which sits halfway between the two squares
+            jumped_bb = ~(1 << ((from_row + to_row) // 2 * 8 + (from_col + to_col) // 2))
+            if white_turn:
+                self.black &= jumped_bb
+                self.bk &= jumped_bb
+            else:
+                self.white &= jumped_bb
+                self.wk &= jumped_bb
             captured = True
         
         # Check if a piece should be promoted to king
-        if piece == PieceType.WHITE and to_row == 0:
-            self.board[to_row][to_col] = PieceType.WHITE_KING
-        elif piece == PieceType.BLACK and to_row == 7:
-            self.board[to_row][to_col] = PieceType.BLACK_KING
+        if not is_king:
+            if white_turn and to_bb & RANK_0:
+                self.wk |= to_bb
+            elif not white_turn and to_bb & RANK_7:
+                self.bk |= to_bb
         
         # Log the move
         self.last_move = (from_pos, to_pos)
@@ -235,32 +522,16 @@ class CheckersGame:
         # Check if there are additional jumps available from the new position
         additional_jumps = False
         if captured:
-            # Check if there are more jumps from the new position
-            possible_jumps = []
-            
-            # Get the possible directions based on piece type
-            move_directions = []
-            if piece == PieceType.WHITE:
-                move_directions = [(-1, -1), (-1, 1)]
-            elif piece == PieceType.BLACK:
-                move_directions = [(1, -1), (1, 1)]
-            else:  # Kings
-                move_directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+            # A piece crowned by this jump keeps moving like a man until the turn ends
+            piece = self.current_turn + _KING_OFFSET if is_king else self.current_turn
+            enemy = self.black if white_turn else self.white
+            empty = DARK_SQUARES & ~(self.white | self.black)
             
             # Check each direction for a possible jump
-            for dr, dc in move_directions:
-                new_row, new_col = to_row + 2*dr, to_col + 2*dc
-                jumped_row, jumped_col = to_row + dr, to_col + dc
-                
-                if 0 <= new_row < 8 and 0 <= new_col < 8 and self.board[new_row][new_col] == PieceType.EMPTY:
-                    jumped_piece = self.board[jumped_row][jumped_col]
-                    
-                    # Check if jumped piece is an opponent's piece
-                    if (self.current_turn == PieceType.WHITE and jumped_piece in [PieceType.BLACK, PieceType.BLACK_KING]) or \
-                       (self.current_turn == PieceType.BLACK and jumped_piece in [PieceType.WHITE, PieceType.WHITE_KING]):
-                        possible_jumps.append(((to_row, to_col), (new_row, new_col)))
-            
-            additional_jumps = len(possible_jumps) > 0
+            for jumped, landing in JUMPS[piece][to_row * 8 + to_col]:
+                if jumped & enemy and landing & empty:
+                    additional_jumps = True
+                    break
         
         # If no additional jumps, switch turns
         if not additional_jumps:
@@ -268,92 +539,160 @@ class CheckersGame:
             
             # Check if the game is over
             self._check_game_over()
-            
-            # If it's AI's turn, make the AI move
-            if self.current_turn == PieceType.BLACK and self.user_id2 is None and self.state != GameState.GAME_OVER:
-                self.make_ai_move()
-        
-        return True
     
     def make_ai_move(self):
         """Make a move for the AI player."""
-        # Always prioritize jumps if available
-        possible_moves = self.get_possible_moves(include_jumps_only=True)
+        # Keep moving while a multi-jump leaves the AI to play again
+        while True:
+            # Always prioritize jumps if available, otherwise consider all possible moves
+            possible_moves = self.get_possible_moves(include_jumps_only=self._any_jump())
+            
+            # If there are no moves, game is over
+            if not possible_moves:
+                self.state = GameState.GAME_OVER
+                self.winner = PieceType.WHITE
+                return
+            
+            # Generated moves are legal, so skip is_valid_move
+            from_pos, to_pos = self._choose_ai_move(possible_moves)
+            self._apply_legal_move(from_pos, to_pos)
+            
+            if self.current_turn != PieceType.BLACK or self.state == GameState.GAME_OVER:
+                return
+    
+    def _choose_ai_move(self, possible_moves: List[Tuple[Tuple[int, int], Tuple[int, int]]]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Pick a move with iterative-deepening alpha-beta search within AI_TIME_BUDGET."""
+        if len(possible_moves) == 1:
+            return possible_moves[0]
         
-        # If no jumps are available, get all possible moves
-        if not possible_moves:
-            possible_moves = self.get_possible_moves()
+        white_turn = self.current_turn == PieceType.WHITE
+        if white_turn:
+            own, enemy, own_kings, enemy_kings = self.white, self.black, self.wk, self.bk
+        else:
+            own, enemy, own_kings, enemy_kings = self.black, self.white, self.bk, self.wk
         
-        # If there are no moves, game is over
-        if not possible_moves:
-            self.state = GameState.GAME_OVER
-            self.winner = PieceType.WHITE
-            return
+        # Shuffle so equally scored moves still vary from game to game
+        root_moves = []
+        for from_pos, to_pos in random.sample(possible_moves, len(possible_moves)):
+            from_bb = 1 << (from_pos[0] * 8 + from_pos[1])
+            to_bb = 1 << (to_pos[0] * 8 + to_pos[1])
+            jumped = 0
+            if abs(to_pos[0] - from_pos[0]) == 2:
+                jumped = 1 << ((from_pos[0] + to_pos[0]) // 2 * 8 + (from_pos[1] + to_pos[1]) // 2)
+            root_moves.append(((from_pos, to_pos), from_bb, to_bb, jumped))
+        
+        key = _zobrist_key(self.white, self.black, self.wk, self.bk, white_turn)
         
-        # Choose a random move (this can be improved with actual AI logic)
-        from_pos, to_pos = random.choice(possible_moves)
-        self.make_move(from_pos, to_pos)
+        best_move = root_moves[0]
+        deadline = time.monotonic() + AI_TIME_BUDGET
+        for depth in range(1, AI_MAX_DEPTH + 1):
+            try:
+                alpha = -_WIN_SCORE * 2
+                depth_best = None
+                for root_move in root_moves:
+                    _, from_bb, to_bb, jumped = root_move
+                    n_own, n_enemy, n_own_kings, n_enemy_kings, n_key, again = _play(
+                        own, enemy, own_kings, enemy_kings, white_turn, key, from_bb, to_bb, jumped
+                    )
+                    if again:
+                        score = _negamax(n_own, n_enemy, n_own_kings, n_enemy_kings, white_turn, n_key,
+                                         depth - 1, alpha, _WIN_SCORE * 2, deadline)
+                    else:
+                        score = -_negamax(n_enemy, n_own, n_enemy_kings, n_own_kings, not white_turn, n_key ^ ZOBRIST_SIDE,
+                                          depth - 1, -_WIN_SCORE * 2, -alpha, deadline)
+                    if score > alpha:
+                        alpha = score
+                        depth_best = root_move
+            except _SearchTimeout:
+                break
+            
+            # Search the best move of this depth first at the next one
+            best_move = depth_best
+            root_moves.remove(depth_best)
+            root_moves.insert(0, depth_best)
+        
+        return best_move[0]
     
     def parse_move(self, move_text: str) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
         """
         Parse a move string in the format "A1-B2" to coordinates.
         Returns (from_pos, to_pos) or (None, None) if invalid format.
         """
-        try:
-            # Remove any spaces and split on the hyphen
-            parts = move_text.replace(" ", "").split("-")
-            if len(parts) != 2:
-                return None, None
-            
-            from_str, to_str = parts
-            
-            # Parse the coordinates (e.g., A1 -> (0, 0))
-            from_col = ord(from_str[0].upper()) - ord('A')
-            from_row = int(from_str[1]) - 1
-            
-            to_col = ord(to_str[0].upper()) - ord('A')
-            to_row = int(to_str[1]) - 1
-            
-            # Check if coordinates are in range
-            if not (0 <= from_row < 8 and 0 <= from_col < 8 and 0 <= to_row < 8 and 0 <= to_col < 8):
-                return None, None
-            
-            return (from_row, from_col), (to_row, to_col)
-            
-        except Exception:
+        # The pattern only admits A-H and 1-8, so no range check is needed
+        match = _MOVE_RE.fullmatch(move_text)
+        if not match:
             return None, None
+        
+        # Parse the coordinates (e.g., A1 -> (0, 0))
+        from_file, from_rank, to_file, to_rank = match.groups()
+        return (
+            (_RANK_INDEX[from_rank], _FILE_INDEX[from_file]),
+            (_RANK_INDEX[to_rank], _FILE_INDEX[to_file]),
+        )
     
     def _check_game_over(self):
         """Check if the game is over (one player has no more pieces or moves)."""
-        # Count pieces
-        white_pieces = 0
-        black_pieces = 0
-        
-        for row in self.board:
-            for piece in row:
-                if piece in [PieceType.WHITE, PieceType.WHITE_KING]:
-                    white_pieces += 1
-                elif piece in [PieceType.BLACK, PieceType.BLACK_KING]:
-                    black_pieces += 1
-        
         # If one player has no pieces, game is over
-        if white_pieces == 0:
+        if not self.white:
             self.state = GameState.GAME_OVER
             self.winner = PieceType.BLACK
             return
         
-        if black_pieces == 0:
+        if not self.black:
             self.state = GameState.GAME_OVER
             self.winner = PieceType.WHITE
             return
         
-        # Check if current player has no moves
-        possible_moves = self.get_possible_moves()
-        if not possible_moves:
+        # Check if current player has no moves (a bitboard test; the AI builds
+        # its own move list afterwards, so none is needed here)
+        if not self._has_moves():
             self.state = GameState.GAME_OVER
             # The player who can't move loses
             self.winner = PieceType.BLACK if self.current_turn == PieceType.WHITE else PieceType.WHITE
             return
 
-# Dictionary to store active games: {chat_id: CheckersGame}
-active_games = {}
\ No newline at end of file
+class GameRegistry:
+    """
+    Active games by chat id, with one asyncio.Lock per chat.
+    Moves in one chat are serialized while other chats proceed in parallel.
+    Locks are kept when a game ends, since a task may still hold or await it.
+    """
+    
+    def __init__(self):
+        self._games: Dict[int, CheckersGame] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+    
+    def __contains__(self, chat_id: int) -> bool:
+        return chat_id in self._games
+    
+    def __getitem__(self, chat_id: int) -> CheckersGame:
+        return self._games[chat_id]
+    
+    def __setitem__(self, chat_id: int, game: CheckersGame) -> None:
+        self._games[chat_id] = game
+    
+    def __delitem__(self, chat_id: int) -> None:
+        del self._games[chat_id]
+    
+    def items(self) -> ItemsView[int, CheckersGame]:
+        return self._games.items()
+    
+    def lock(self, chat_id: int) -> asyncio.Lock:
+        """Get the lock guarding a chat's game, creating it on first use."""
+        lock = self._locks.get(chat_id)
+        if lock is None:
+            lock = self._locks[chat_id] = asyncio.Lock()
+        return lock
+    
+    def remove(self, chat_id: int) -> None:
+        """Drop a chat's game, if present; its lock stays in place."""
+        self._games.pop(chat_id, None)
+    
+    @contextlib.asynccontextmanager
+    async def with_game(self, chat_id: int) -> AsyncIterator[Optional[CheckersGame]]:
+        """Hold the chat's lock and yield its game (None if there is none)."""
+        async with self.lock(chat_id):
+            yield self._games.get(chat_id)
+
+# Active games: {chat_id: CheckersGame}
+active_games = GameRegistry()
\ No newline at end of file
@@ -22,7 +22,14 @@ MAX_CONTEXT_LENGTH = 10  # Maximum number of messages to keep in conversation co
 
 # Paths
 DOWNLOADS_FOLDER = "downloads"
-os.makedirs(DOWNLOADS_FOLDER, exist_ok=True)
+_downloads_ready = False
+
+def ensure_downloads_dir() -> None:
+    """Create DOWNLOADS_FOLDER on first use instead of at import time."""
+    global _downloads_ready
+    if not _downloads_ready:
+        os.makedirs(DOWNLOADS_FOLDER, exist_ok=True)
+        _downloads_ready = True
 
 # File size limits
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB (Telegram limit)
@@ -1,49 +1,68 @@
-from collections import defaultdict
-from typing import List, Dict
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Deque, List, Dict
+import sys
 import time
 
+# Stored roles are interned, so every message shares one string per role
+_USER = sys.intern("user")
+_ASSISTANT = sys.intern("assistant")
+_ROLE_INTERN = {_USER: _USER, _ASSISTANT: _ASSISTANT}
+
+def _intern_role(role: str) -> str:
+    """Return the shared string for a role."""
+    return _ROLE_INTERN.get(role) or sys.intern(role)
+
+@dataclass(slots=True)
+class Message:
+    """A single stored conversation message."""
+    role: str
+    content: str
+    timestamp: float
+
 class ConversationManager:
     def __init__(self, max_context_length: int = 10):
-        self.conversations: Dict[int, List[Dict]] = defaultdict(list)
+        # Bounded deques drop the oldest message on append once the window is full
+        self.conversations: Dict[int, Deque[Message]] = defaultdict(lambda: deque(maxlen=max_context_length))
         self.max_context_length = max_context_length
-        self.last_interaction: Dict[int, float] = defaultdict(float)
+        self.last_interaction: Dict[int, float] = {}
 
     def add_message(self, user_id: int, role: str, content: str, timestamp=None) -> None:
         """Add a message to the conversation history."""
         if timestamp is None:
             timestamp = time.time()
 
-        self.conversations[user_id].append({
-            "role": role,
-            "content": content,
-            "timestamp": timestamp
-        })
+        role = _intern_role(role)
+        self.conversations[user_id].append(Message(role, content, timestamp))
 
-        # Update last interaction time
-        self.last_interaction[user_id] = timestamp
-
-        # Trim conversation if it's too long
-        if len(self.conversations[user_id]) > self.max_context_length:
-            self.conversations[user_id] = self.conversations[user_id][-self.max_context_length:]
+        # Update last interaction time, skipping the write when it doesn't move forward
+        if timestamp > self.last_interaction.get(user_id, 0.0):
+            self.last_interaction[user_id] = timestamp
 
     def add_history(self, user_id: int, messages: List[Dict]) -> None:
         """Add multiple historical messages at once."""
         # Sort messages by timestamp to maintain chronological order
         sorted_messages = sorted(messages, key=lambda x: x.get('timestamp', 0))
 
-        # Add each message while respecting max_context_length
-        for msg in sorted_messages:
-            self.add_message(
-                user_id=user_id,
-                role=msg.get('role', 'user'),
-                content=msg.get('content', ''),
-                timestamp=msg.get('timestamp', time.time())
-            )
+        if not sorted_messages:
+            return
+
+        # Only the newest max_context_length messages can survive, so skip the rest
+        now = time.time()
+        self.conversations[user_id].extend(
+            Message(_intern_role(msg.get('role', _USER)), msg.get('content', ''), msg.get('timestamp', now))
+            for msg in sorted_messages[-self.max_context_length:]
+        )
+
+        # Update last interaction time once, from the newest message
+        newest = sorted_messages[-1].get('timestamp', now)
+        if newest > self.last_interaction.get(user_id, 0.0):
+            self.last_interaction[user_id] = newest
 
     def get_context(self, user_id: int) -> List[Dict]:
         """Get the conversation context for a user."""
         return [
-            {"role": msg["role"], "content": msg["content"]}
+            {"role": msg.role, "content": msg.content}
             for msg in self.conversations[user_id]
         ]
 
@@ -54,12 +73,12 @@ class ConversationManager:
 
         summary = []
         for msg in self.conversations[user_id]:
-            role = "You" if msg["role"] == "user" else "Assistant"
-            summary.append(f"{role}: {msg['content']}")
+            role = "You" if msg.role is _USER else "Assistant"
+            summary.append(f"{role}: {msg.content}")
 
         return "\n".join(summary)
 
     def clear_context(self, user_id: int) -> None:
         """Clear the conversation context for a user."""
-        self.conversations[user_id] = []
+        self.conversations[user_id].clear()
         self.last_interaction[user_id] = time.time()
\ No newline at end of file
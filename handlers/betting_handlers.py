@@ -1,12 +1,16 @@
 """
 Betting game handlers for the Telegram bot.
 """
+import asyncio
+import functools
 import logging
-import re
+import weakref
+from datetime import timedelta
 import random
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, NamedTuple
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import RetryAfter
 from telegram.ext import ContextTypes
 
 from betting_game import (
@@ -14,8 +18,8 @@ from betting_game import (
     create_betting_game, get_betting_game, remove_betting_game
 )
 from wallet_system import (
-    get_balance, add_funds, deduct_funds, create_bet, join_bet, cancel_bet, settle_bet,
-    reset_wallet, admin_set_balance, admin_add_balance, admin_remove_balance, admin_list_all_wallets
+    ADMIN_ID, get_balance, add_funds, deduct_funds, create_bet, join_bet, cancel_bet, settle_bet,
+    reset_wallet, admin_set_balance, admin_add_balance, admin_remove_balance, admin_list_wallets_page
 )
 
 # Default bet amount for quick commands
@@ -27,6 +31,272 @@ logger = logging.getLogger(__name__)
 BTN_JOIN_GAME = "join_betting_game"
 BTN_MAKE_MOVE = "betting_game_move"
 BTN_CANCEL_GAME = "cancel_betting_game"
+BTN_REFRESH = "refresh"
+BTN_WALLETS_PAGE = "admin_wallets_page"
+
+# Wallets shown per /adminlistwallets page
+WALLETS_PAGE_SIZE = 20
+
+# Per-game locks; an entry lives only while some callback holds or awaits it
+_GAME_LOCKS = weakref.WeakValueDictionary()
+
+def _lock_for(game_id: str) -> asyncio.Lock:
+    """Get the lock that serializes callbacks for a betting game."""
+    lock = _GAME_LOCKS.get(game_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _GAME_LOCKS[game_id] = lock
+    return lock
+
+# Edits of other players' game messages go through a small worker pool. Pending
+# edits are keyed by (chat_id, message_id) so only the latest text is sent, and
+# a message is sent by at most one worker at a time so edits can't reorder.
+_EDIT_WORKERS = 4
+_EDIT_ATTEMPTS = 3
+_EDIT_INTERVAL = 1 / 25  # Seconds between queued edits, under Telegram's ~30/s bot limit
+_EDIT_DRAIN_TIMEOUT = 5.0  # Seconds shutdown waits for queued edits to go out
+_next_edit_at = 0.0
+_edit_queue: Optional[asyncio.Queue] = None
+_pending_edits: Dict[Tuple[int, int], tuple] = {}
+_edit_workers: List[asyncio.Task] = []
+_edits_in_flight = set()
+
+def _queue_edit(bot, chat_id: int, message_id: int, text: str, reply_markup=None) -> None:
+    """Queue an edit of a player's game message, replacing any pending edit of it."""
+    global _edit_queue
+    if _edit_queue is None:
+        _edit_queue = asyncio.Queue()
+        _edit_workers.extend(asyncio.create_task(_edit_worker()) for _ in range(_EDIT_WORKERS))
+    
+    key = (chat_id, message_id)
+    if key not in _pending_edits:
+        _edit_queue.put_nowait(key)
+    _pending_edits[key] = (bot, text, reply_markup, 0)
+
+async def _wait_edit_slot() -> None:
+    """Space queued edits _EDIT_INTERVAL apart across all workers."""
+    global _next_edit_at
+    now = asyncio.get_running_loop().time()
+    wait = _next_edit_at - now
+    _next_edit_at = max(now, _next_edit_at) + _EDIT_INTERVAL
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+async def _send_queued_edit(key: Tuple[int, int]) -> None:
+    """Send the latest pending edit for a message, handling rate limits."""
+    global _next_edit_at
+    # Wait for a send slot before taking the payload, so edits queued for
+    # the same message meanwhile are folded into this send
+    await _wait_edit_slot()
+    bot, text, reply_markup, attempt = _pending_edits.pop(key)
+    chat_id, message_id = key
+    try:
+        await bot.edit_message_text(
+            text,
+            chat_id=chat_id,
+            message_id=message_id,
+            reply_markup=reply_markup,
+            parse_mode="Markdown"
+        )
+    except RetryAfter as e:
+        delay = e.retry_after
+        if isinstance(delay, timedelta):
+            delay = delay.total_seconds()
+        # Hold back every worker, not just this one, until the limit lifts
+        _next_edit_at = max(_next_edit_at, asyncio.get_running_loop().time() + delay)
+        # Retry unless a newer edit of the same message was queued meanwhile
+        if key not in _pending_edits and attempt + 1 < _EDIT_ATTEMPTS:
+            _pending_edits[key] = (bot, text, reply_markup, attempt + 1)
+    except Exception as e:
+        logger.error(f"Error updating game message {chat_id}/{message_id}: {e}")
+
+async def _edit_worker() -> None:
+    """Send queued message edits, one worker per message at a time."""
+    while True:
+        key = await _edit_queue.get()
+        try:
+            # The worker already sending this message re-queues it when done,
+            # and a key can be queued twice after its edit was already sent
+            if key in _edits_in_flight or key not in _pending_edits:
+                continue
+            _edits_in_flight.add(key)
+            try:
+                await _send_queued_edit(key)
+            finally:
+                _edits_in_flight.discard(key)
+                # Pick up a newer edit (or a retry) queued while this one was sent
+                if key in _pending_edits:
+                    _edit_queue.put_nowait(key)
+        finally:
+            _edit_queue.task_done()
+
+async def shutdown_edit_queue(timeout: float = _EDIT_DRAIN_TIMEOUT) -> None:
+    """Give queued edits a moment to go out, then stop the edit workers."""
+    global _edit_queue
+    if _edit_queue is None:
+        return
+    
+    try:
+        await asyncio.wait_for(_edit_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Dropping {len(_pending_edits)} unsent game message edits")
+    
+    for task in _edit_workers:
+        task.cancel()
+    await asyncio.gather(*_edit_workers, return_exceptions=True)
+    _edit_workers.clear()
+    _pending_edits.clear()
+    _edits_in_flight.clear()
+    _edit_queue = None
+
+# Move keyboards as (label, move) rows; only the game ID in callback_data varies
+_NUMBER_EMOJI = ("1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟")
+_SOLO_MOVE_ROWS = {
+    GameType.DICE_ROLL: ((("🎲 Roll Dice", "roll"),),),
+    GameType.COIN_FLIP: ((("Heads", "heads"), ("Tails", "tails")),),
+    GameType.NUMBER_GUESS: (
+        tuple((str(i), str(i)) for i in range(1, 6)),
+        tuple((str(i), str(i)) for i in range(6, 11)),
+    ),
+    GameType.ROCK_PAPER_SCISSORS: (
+        (("🪨 Rock", "rock"), ("📄 Paper", "paper"), ("✂️ Scissors", "scissors")),
+    ),
+}
+_MOVE_ROWS = {
+    GameType.DICE_ROLL: ((("🎲 Roll Dice", "roll"),),),
+    GameType.COIN_FLIP: ((("Heads", "heads"), ("Tails", "tails")),),
+    GameType.NUMBER_GUESS: (
+        tuple((_NUMBER_EMOJI[i - 1], str(i)) for i in range(1, 6)),
+        tuple((_NUMBER_EMOJI[i - 1], str(i)) for i in range(6, 11)),
+    ),
+    GameType.ROCK_PAPER_SCISSORS: (
+        (("Rock 👊", "rock"),),
+        (("Paper 🖐", "paper"),),
+        (("Scissors ✂️", "scissors"),),
+    ),
+}
+_DEFAULT_MOVE_ROWS = ((("Make Move", "default"),),)
+_YOUR_TURN_ROW = (InlineKeyboardButton("▶️ Your Turn - Choose Your Move ▶️", callback_data="none"),)
+
+@functools.lru_cache(maxsize=4096)
+def _move_buttons(game_type: GameType, game_id: str, solo: bool = False) -> tuple:
+    """Build (and cache) the move button rows for a game."""
+    layout = (_SOLO_MOVE_ROWS if solo else _MOVE_ROWS).get(game_type, _DEFAULT_MOVE_ROWS)
+    return tuple(
+        tuple(
+            InlineKeyboardButton(label, callback_data=f"{BTN_MAKE_MOVE}:{game_id}:{move}")
+            for label, move in row
+        )
+        for row in layout
+    )
+
+def solo_move_keyboard(game_type: GameType, game_id: str) -> InlineKeyboardMarkup:
+    """Move keyboard for a new single-player game (shared with the start menu)."""
+    return InlineKeyboardMarkup(_move_buttons(game_type, game_id, solo=True))
+
+class _ControlRows(NamedTuple):
+    join: tuple
+    cancel: tuple
+    refresh: tuple
+    refresh_status: tuple
+
+@functools.lru_cache(maxsize=4096)
+def _control_rows(game_id: str) -> _ControlRows:
+    """Build (and cache) the non-move control rows for a game."""
+    refresh_data = f"{BTN_REFRESH}:{game_id}"
+    return _ControlRows(
+        join=(InlineKeyboardButton("Join Game", callback_data=f"{BTN_JOIN_GAME}:{game_id}"),),
+        cancel=(InlineKeyboardButton("Cancel Game", callback_data=f"{BTN_CANCEL_GAME}:{game_id}"),),
+        refresh=(InlineKeyboardButton("↻ Refresh", callback_data=refresh_data),),
+        refresh_status=(InlineKeyboardButton("↻ Refresh Status", callback_data=refresh_data),),
+    )
+
+# Bound once; randrange skips randint's extra call layer
+_randrange = random.randrange
+
+# Valid move and "solo" tokens
+_COIN_MOVES = frozenset(("heads", "tails"))
+_RPS_MOVES = frozenset(("rock", "paper", "scissors"))
+_SOLO_TOKENS = frozenset(("solo", "single", "sp", "s"))
+
+# /bet game names (and aliases) -> game type
+_GAME_TYPES = {
+    "dice": GameType.DICE_ROLL,
+    "coin": GameType.COIN_FLIP,
+    "number": GameType.NUMBER_GUESS,
+    "rps": GameType.ROCK_PAPER_SCISSORS,
+    "rock": GameType.ROCK_PAPER_SCISSORS,
+    "paper": GameType.ROCK_PAPER_SCISSORS,
+    "scissors": GameType.ROCK_PAPER_SCISSORS,
+}
+
+def _parse_dice(move_str: str) -> int:
+    """Dice moves are rolled automatically, whatever the button said."""
+    return _randrange(1, 7)
+
+def _parse_coin(move_str: str) -> Optional[str]:
+    return move_str if move_str in _COIN_MOVES else None
+
+def _parse_number(move_str: str) -> Optional[int]:
+    try:
+        number = int(move_str)
+    except ValueError:
+        return None
+    return number if 1 <= number <= 10 else None
+
+def _parse_rps(move_str: str) -> Optional[PlayerMove]:
+    return PlayerMove(move_str) if move_str in _RPS_MOVES else None
+
+# Game type -> (move parser, message shown when the parser rejects the move)
+_MOVE_PARSERS = {
+    GameType.DICE_ROLL: (_parse_dice, ""),
+    GameType.COIN_FLIP: (_parse_coin, "Invalid move. Choose heads or tails."),
+    GameType.NUMBER_GUESS: (_parse_number, "Invalid number. Choose between 1 and 10."),
+    GameType.ROCK_PAPER_SCISSORS: (_parse_rps, "Invalid move. Choose rock, paper, or scissors."),
+}
+
+# Game type -> how a recorded move reads in "You've already ..." style messages
+_MOVE_DESCRIPTIONS = {
+    GameType.DICE_ROLL: lambda move: f"rolled a 🎲 {move}",
+    GameType.COIN_FLIP: lambda move: f"chose {str(move).capitalize()}",
+    GameType.NUMBER_GUESS: lambda move: f"picked the number {move}",
+    GameType.ROCK_PAPER_SCISSORS: lambda move: f"chose {str(getattr(move, 'value', move)).capitalize()}",
+}
+
+def _describe_move(game_type: GameType, move) -> str:
+    describe = _MOVE_DESCRIPTIONS.get(game_type)
+    return describe(move) if describe else ""
+
+# /wallet help text around the balance, plus the admin-only section
+_WALLET_PREFIX = "💰 *Your Virtual Wallet*\n\nCurrent Balance: *"
+_WALLET_SUFFIX = (
+    "* credits\n\n"
+    "*Commands:*\n"
+    "• `/wallet` - View your balance\n"
+    "• `/resetwallet` - Reset your balance to default\n"
+    "• `/bet dice <amount> [solo]` - Dice roll game\n"
+    "• `/bet coin <amount> [solo]` - Coin flip game\n"
+    "• `/bet number <amount> [solo]` - Number guessing game\n"
+    "• `/bet rps <amount> [solo]` - Rock-paper-scissors\n\n"
+    "*Single Player:* Add 'solo' to play against the bot\n"
+    "Example: `/bet dice 100 solo`\n\n"
+    "*Note:* This is a virtual wallet for testing purposes only. No real money is involved."
+    "\n\n💎 *Crypto Betting (REAL Money)*\n"
+    "You can now bet with real cryptocurrency using @cctip_bot!\n"
+    "• `/cryptobet dice <amount> <crypto>` - Dice with crypto\n"
+    "• `/cryptobet coin <amount> <crypto>` - Coin flip with crypto\n"
+    "• `/cryptobet number <amount> <crypto>` - Number game with crypto\n"
+    "• `/cryptobet rps <amount> <crypto>` - RPS with crypto\n\n"
+    "Supported cryptocurrencies: DOGE, TRX, USDT, BNB\n"
+    "Example: `/cryptobet dice 1 doge`"
+)
+_WALLET_ADMIN_HELP = (
+    "\n\n*🔐 Admin Commands:*\n"
+    "• `/adminsetbalance <user_id> <amount>` - Set a user's balance\n"
+    "• `/adminaddbalance <user_id> <amount>` - Add to a user's balance\n"
+    "• `/adminremovebalance <user_id> <amount>` - Remove from a user's balance\n"
+    "• `/adminlistwallets [page]` - List wallet balances, highest first\n"
+)
 
 async def wallet_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
@@ -36,44 +306,12 @@ async def wallet_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     user_id = update.effective_user.id
     balance = get_balance(user_id)
     
-    help_text = (
-        f"💰 *Your Virtual Wallet*\n\n"
-        f"Current Balance: *{balance}* credits\n\n"
-        f"*Commands:*\n"
-        f"• `/wallet` - View your balance\n"
-        f"• `/resetwallet` - Reset your balance to default\n"
-        f"• `/bet dice <amount> [solo]` - Dice roll game\n"
-        f"• `/bet coin <amount> [solo]` - Coin flip game\n"
-        f"• `/bet number <amount> [solo]` - Number guessing game\n"
-        f"• `/bet rps <amount> [solo]` - Rock-paper-scissors\n\n"
-        f"*Single Player:* Add 'solo' to play against the bot\n"
-        f"Example: `/bet dice 100 solo`\n\n"
-        f"*Note:* This is a virtual wallet for testing purposes only. No real money is involved."
-    )
-    
-    # Add crypto betting information
-    crypto_text = (
-        f"\n\n💎 *Crypto Betting (REAL Money)*\n"
-        f"You can now bet with real cryptocurrency using @cctip_bot!\n"
-        f"• `/cryptobet dice <amount> <crypto>` - Dice with crypto\n"
-        f"• `/cryptobet coin <amount> <crypto>` - Coin flip with crypto\n"
-        f"• `/cryptobet number <amount> <crypto>` - Number game with crypto\n"
-        f"• `/cryptobet rps <amount> <crypto>` - RPS with crypto\n\n"
-        f"Supported cryptocurrencies: DOGE, TRX, USDT, BNB\n"
-        f"Example: `/cryptobet dice 1 doge`"
-    )
-    help_text += crypto_text
+    # Only the balance varies; the surrounding help text is built once at import
+    help_text = f"{_WALLET_PREFIX}{balance}{_WALLET_SUFFIX}"
     
     # Add admin commands for the special admin user
-    if user_id == 1159603709:
-        admin_text = (
-            f"\n\n*🔐 Admin Commands:*\n"
-            f"• `/adminsetbalance <user_id> <amount>` - Set a user's balance\n"
-            f"• `/adminaddbalance <user_id> <amount>` - Add to a user's balance\n"
-            f"• `/adminremovebalance <user_id> <amount>` - Remove from a user's balance\n"
-            f"• `/adminlistwallets` - List all wallet balances\n"
-        )
-        help_text += admin_text
+    if user_id == ADMIN_ID:
+        help_text += _WALLET_ADMIN_HELP
     
     await update.message.reply_markdown(help_text)
 
@@ -91,19 +329,13 @@ async def reset_wallet_command(update: Update, context: ContextTypes.DEFAULT_TYP
     )
 
 # Admin commands
-async def admin_set_balance_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """
-    Admin command to set a user's balance to a specific amount.
-    Format: /adminsetbalance <user_id> <amount>
-    """
+async def _admin_balance_op(update: Update, context: ContextTypes.DEFAULT_TYPE, op, usage: str) -> None:
+    """Parse <user_id> <amount>, run a wallet admin operation and report its result."""
     admin_id = update.effective_user.id
     
     # Check arguments
     if not context.args or len(context.args) != 2:
-        await update.message.reply_text(
-            "Usage: /adminsetbalance <user_id> <amount>\n"
-            "Example: /adminsetbalance 123456789 1000"
-        )
+        await update.message.reply_text(usage)
         return
     
     try:
@@ -113,109 +345,107 @@ async def admin_set_balance_command(update: Update, context: ContextTypes.DEFAUL
         await update.message.reply_text("User ID and amount must be numbers.")
         return
     
-    success, message = admin_set_balance(admin_id, target_user_id, amount)
-    
-    if success:
-        await update.message.reply_markdown(f"✅ {message}")
-    else:
-        await update.message.reply_markdown(f"❌ {message}")
+    success, message = op(admin_id, target_user_id, amount)
+    await update.message.reply_markdown(f"{'✅' if success else '❌'} {message}")
+
+async def admin_set_balance_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Admin command to set a user's balance to a specific amount.
+    Format: /adminsetbalance <user_id> <amount>
+    """
+    await _admin_balance_op(
+        update, context, admin_set_balance,
+        "Usage: /adminsetbalance <user_id> <amount>\n"
+        "Example: /adminsetbalance 123456789 1000"
+    )
 
 async def admin_add_balance_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Admin command to add to a user's balance.
     Format: /adminaddbalance <user_id> <amount>
     """
-    admin_id = update.effective_user.id
-    
-    # Check arguments
-    if not context.args or len(context.args) != 2:
-        await update.message.reply_text(
-            "Usage: /adminaddbalance <user_id> <amount>\n"
-            "Example: /adminaddbalance 123456789 500"
-        )
-        return
-    
-    try:
-        target_user_id = int(context.args[0])
-        amount = int(context.args[1])
-    except ValueError:
-        await update.message.reply_text("User ID and amount must be numbers.")
-        return
-    
-    success, message = admin_add_balance(admin_id, target_user_id, amount)
-    
-    if success:
-        await update.message.reply_markdown(f"✅ {message}")
-    else:
-        await update.message.reply_markdown(f"❌ {message}")
+    await _admin_balance_op(
+        update, context, admin_add_balance,
+        "Usage: /adminaddbalance <user_id> <amount>\n"
+        "Example: /adminaddbalance 123456789 500"
+    )
 
 async def admin_remove_balance_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Admin command to remove from a user's balance.
     Format: /adminremovebalance <user_id> <amount>
     """
-    admin_id = update.effective_user.id
+    await _admin_balance_op(
+        update, context, admin_remove_balance,
+        "Usage: /adminremovebalance <user_id> <amount>\n"
+        "Example: /adminremovebalance 123456789 200"
+    )
+
+def _render_wallets_page(admin_id: int, page: int) -> Optional[Tuple[str, Optional[InlineKeyboardMarkup]]]:
+    """Build the text and Prev/Next buttons for a page of wallets, or None if not allowed."""
+    page = max(page, 1)
+    success, rows, total = admin_list_wallets_page(admin_id, (page - 1) * WALLETS_PAGE_SIZE, WALLETS_PAGE_SIZE)
+    if not success:
+        return None
     
-    # Check arguments
-    if not context.args or len(context.args) != 2:
-        await update.message.reply_text(
-            "Usage: /adminremovebalance <user_id> <amount>\n"
-            "Example: /adminremovebalance 123456789 200"
-        )
-        return
+    if not total:
+        return "No wallet data available.", None
     
-    try:
-        target_user_id = int(context.args[0])
-        amount = int(context.args[1])
-    except ValueError:
-        await update.message.reply_text("User ID and amount must be numbers.")
-        return
+    # Clamp pages past the end (e.g. after wallets were removed)
+    pages = -(-total // WALLETS_PAGE_SIZE)
+    if page > pages:
+        page = pages
+        _, rows, total = admin_list_wallets_page(admin_id, (page - 1) * WALLETS_PAGE_SIZE, WALLETS_PAGE_SIZE)
     
-    success, message = admin_remove_balance(admin_id, target_user_id, amount)
+    lines = [f"💰 *Wallet Balances* (page {page}/{pages})\n"]
+    lines.extend(f"User ID: `{user_id}` - Balance: *{balance}* credits" for user_id, balance in rows)
     
-    if success:
-        await update.message.reply_markdown(f"✅ {message}")
-    else:
-        await update.message.reply_markdown(f"❌ {message}")
+    buttons = []
+    if page > 1:
+        buttons.append(InlineKeyboardButton("« Prev", callback_data=f"{BTN_WALLETS_PAGE}:{page - 1}"))
+    if page < pages:
+        buttons.append(InlineKeyboardButton("Next »", callback_data=f"{BTN_WALLETS_PAGE}:{page + 1}"))
+    
+    return "\n".join(lines), InlineKeyboardMarkup((buttons,)) if buttons else None
 
 async def admin_list_wallets_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
-    Admin command to list all wallet balances.
-    Format: /adminlistwallets
+    Admin command to list wallet balances, one page at a time.
+    Format: /adminlistwallets [page]
     """
     admin_id = update.effective_user.id
     
-    success, wallet_data = admin_list_all_wallets(admin_id)
+    try:
+        page = int(context.args[0]) if context.args else 1
+    except ValueError:
+        await update.message.reply_text("Usage: /adminlistwallets [page]")
+        return
     
-    if not success:
+    rendered = _render_wallets_page(admin_id, page)
+    if rendered is None:
         await update.message.reply_text("You don't have permission to view wallet data.")
         return
     
-    # Format the wallet data
-    if not wallet_data:
-        await update.message.reply_text("No wallet data available.")
+    text, reply_markup = rendered
+    await update.message.reply_markdown(text, reply_markup=reply_markup)
+
+async def admin_wallets_page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle the Prev/Next buttons of /adminlistwallets."""
+    query = update.callback_query
+    try:
+        page = int(query.data.partition(":")[2])
+    except ValueError:
+        await query.answer()
         return
     
-    # Sort wallets by balance (highest first)
-    sorted_wallets = sorted(wallet_data.items(), key=lambda x: x[1], reverse=True)
-    
-    # Prepare message in chunks to avoid message size limits
-    wallet_text = "💰 *Wallet Balances*\n\n"
-    current_chunk = wallet_text
-    
-    for user_id, balance in sorted_wallets:
-        line = f"User ID: `{user_id}` - Balance: *{balance}* credits\n"
-        
-        # If adding this line would make the message too long, send the current chunk
-        if len(current_chunk) + len(line) > 4000:
-            await update.message.reply_markdown(current_chunk)
-            current_chunk = ""
-        
-        current_chunk += line
+    rendered = _render_wallets_page(query.from_user.id, page)
+    if rendered is None:
+        await query.answer("You don't have permission to view wallet data.", show_alert=True)
+        return
     
-    # Send the final chunk if it has any content
-    if current_chunk:
-        await update.message.reply_markdown(current_chunk)
+    await query.answer()
+    text, reply_markup = rendered
+    await query.edit_message_text(text, reply_markup=reply_markup, parse_mode="Markdown")
 
 async def bet_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
@@ -226,10 +456,11 @@ async def bet_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
       /bet coin 50 solo
     """
     user_id = update.effective_user.id
-    chat_id = update.effective_chat.id
     
-    # Check if we have arguments
-    if not context.args or len(context.args) < 2:
+    # Unpack game type, bet amount and the optional solo flag
+    try:
+        game_type_str, amount_str, *rest = context.args or ()
+    except ValueError:
         await update.message.reply_text(
             "Please specify a game type and bet amount.\n"
             "Example: /bet dice 100\n"
@@ -238,55 +469,39 @@ async def bet_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         return
     
-    # Parse game type and bet amount
-    game_type_str = context.args[0].lower()
+    game_type_str = game_type_str.lower()
     try:
-        bet_amount = int(context.args[1])
+        bet_amount = int(amount_str)
     except ValueError:
         await update.message.reply_text("Bet amount must be a number.")
         return
     
     # Check if this is a single-player game
-    single_player = False
-    if len(context.args) > 2 and context.args[2].lower() in ["solo", "single", "sp", "s"]:
-        single_player = True
+    single_player = bool(rest) and rest[0].lower() in _SOLO_TOKENS
     
     # Validate bet amount
     if bet_amount <= 0:
         await update.message.reply_text("Bet amount must be greater than 0.")
         return
     
-    # Check if user has enough balance
-    user_balance = get_balance(user_id)
-    if user_balance < bet_amount:
-        await update.message.reply_markdown(
-            f"❌ You don't have enough credits!\n\n"
-            f"Your Balance: *{user_balance}* credits\n"
-            f"Bet Amount: *{bet_amount}* credits\n\n"
-            f"Use `/wallet` to check your balance."
-        )
-        return
-    
     # Determine game type
-    game_type = None
-    if game_type_str == "dice":
-        game_type = GameType.DICE_ROLL
-    elif game_type_str == "coin":
-        game_type = GameType.COIN_FLIP
-    elif game_type_str == "number":
-        game_type = GameType.NUMBER_GUESS
-    elif game_type_str in ["rps", "rock", "paper", "scissors"]:
-        game_type = GameType.ROCK_PAPER_SCISSORS
-    else:
+    game_type = _GAME_TYPES.get(game_type_str)
+    if game_type is None:
         await update.message.reply_text(
             "Invalid game type. Available games: dice, coin, number, rps"
         )
         return
     
-    # Deduct the bet amount from the user's balance
-    success, new_balance = deduct_funds(user_id, bet_amount)
+    # Deduct the bet amount; on failure deduct_funds returns the current balance,
+    # so there's no separate balance read up front
+    success, user_balance = deduct_funds(user_id, bet_amount)
     if not success:
-        await update.message.reply_text(f"Error deducting funds. Please try again.")
+        await update.message.reply_markdown(
+            f"❌ You don't have enough credits!\n\n"
+            f"Your Balance: *{user_balance}* credits\n"
+            f"Bet Amount: *{bet_amount}* credits\n\n"
+            f"Use `/wallet` to check your balance."
+        )
         return
     
     # Create the betting game (with single player option if specified)
@@ -308,43 +523,11 @@ async def bet_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
             await update.message.reply_text(f"Error creating bet: {message}")
             return
         
-        # Create buttons for joining the game
-        keyboard = [
-            [InlineKeyboardButton("Join Game", callback_data=f"{BTN_JOIN_GAME}:{game.game_id}")],
-            [InlineKeyboardButton("Cancel Game", callback_data=f"{BTN_CANCEL_GAME}:{game.game_id}")]
-        ]
+        rows = _control_rows(game.game_id)
+        keyboard = (rows.join, rows.cancel)
     else:
-        # Create appropriate game buttons for single player game
-        keyboard = []
-        
-        if game_type == GameType.DICE_ROLL:
-            # Dice game - player just rolls
-            keyboard = [[InlineKeyboardButton("🎲 Roll Dice", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:roll")]]
-        
-        elif game_type == GameType.COIN_FLIP:
-            # Coin flip - player guesses heads or tails
-            keyboard = [
-                [
-                    InlineKeyboardButton("Heads", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:heads"),
-                    InlineKeyboardButton("Tails", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:tails")
-                ]
-            ]
-            
-        elif game_type == GameType.NUMBER_GUESS:
-            # Number guessing - provide number buttons 1-10
-            row1 = [InlineKeyboardButton(str(i), callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:{i}") for i in range(1, 6)]
-            row2 = [InlineKeyboardButton(str(i), callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:{i}") for i in range(6, 11)]
-            keyboard = [row1, row2]
-            
-        elif game_type == GameType.ROCK_PAPER_SCISSORS:
-            # Rock Paper Scissors - provide RPS buttons
-            keyboard = [
-                [
-                    InlineKeyboardButton("🪨 Rock", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:rock"),
-                    InlineKeyboardButton("📄 Paper", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:paper"),
-                    InlineKeyboardButton("✂️ Scissors", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:scissors")
-                ]
-            ]
+        # Single player games go straight to the move buttons
+        keyboard = _move_buttons(game_type, game.game_id, solo=True)
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -359,32 +542,21 @@ async def handle_betting_callback(update: Update, context: ContextTypes.DEFAULT_
     Handle callbacks for betting games.
     Returns True if callback was processed, False otherwise.
     """
+    # Registered via CallbackQueryHandler, so callback_query is always set
     query = update.callback_query
-    if not query:
-        return False
+    user_id = query.from_user.id
     
-    callback_data = query.data
-    user_id = update.effective_user.id
-    
-    # Check if this is a betting game callback
-    if not any(callback_data.startswith(prefix) for prefix in [BTN_JOIN_GAME, BTN_MAKE_MOVE, BTN_CANCEL_GAME, "refresh"]):
+    # Split the callback data once and route on its prefix
+    prefix, _, tail = query.data.partition(":")
+    handler = _CALLBACK_HANDLERS.get(prefix)
+    if handler is None:
         return False
+    game_id, _, move = tail.partition(":")
     
-    # Extract game_id from callback data
-    game_id = None
-    if callback_data.startswith(BTN_JOIN_GAME):
-        _, game_id = callback_data.split(":", 1)
-    elif callback_data.startswith(BTN_MAKE_MOVE):
-        parts = callback_data.split(":", 2)
-        if len(parts) >= 2:
-            game_id = parts[1]
-    elif callback_data.startswith(BTN_CANCEL_GAME):
-        _, game_id = callback_data.split(":", 1)
-    elif callback_data.startswith("refresh"):
-        _, game_id = callback_data.split(":", 1)
-    
-    # For non-join actions, check if user is part of the game
-    if game_id and not callback_data.startswith(BTN_JOIN_GAME):
+    # For non-join actions, check if user is part of the game. This read runs
+    # before the game lock, which is fine: handlers run on one event loop and
+    # only mutate players under the lock, and they re-check membership there.
+    if game_id and prefix != BTN_JOIN_GAME:
         game = get_betting_game(game_id)
         if game and user_id not in game.players:
             # Silently acknowledge the callback without changing the message
@@ -394,73 +566,50 @@ async def handle_betting_callback(update: Update, context: ContextTypes.DEFAULT_
     # Process the callback
     await query.answer()
     
-    if callback_data.startswith(BTN_JOIN_GAME):
-        # Join a betting game
-        _, game_id = callback_data.split(":", 1)
-        return await process_join_game(query, game_id, user_id)
+    # Serialize callbacks on the same game so state checks, joins and
+    # settlement from concurrent clicks can't interleave
+    async with _lock_for(game_id):
+        if prefix != BTN_MAKE_MOVE:
+            return await handler(query, game_id, user_id)
+        return await handler(query, game_id, user_id, move, context)
+
+async def _process_move_callback(query, game_id: str, user_id: int, move: str, context: ContextTypes.DEFAULT_TYPE) -> bool:
+    """Validate a move callback before handing it to process_make_move."""
+    # Make a move in a betting game
+    if not move:
+        await query.edit_message_text("Invalid move format.")
+        return True
     
-    elif callback_data.startswith(BTN_MAKE_MOVE):
-        # Make a move in a betting game
-        parts = callback_data.split(":", 2)
-        if len(parts) < 3:
-            await query.edit_message_text("Invalid move format.")
-            return True
+    # Check if the game exists (it may have ended while we waited for the lock)
+    game = get_betting_game(game_id)
+    if not game:
+        await query.answer("This game no longer exists.", show_alert=True)
+        return True
         
-        _, game_id, move = parts
-        # Check if the game exists and the user is in it
-        game = get_betting_game(game_id)
-        if not game:
-            await query.answer("This game no longer exists.", show_alert=True)
-            return True
-            
-        # Check if the user has already made a move
-        if user_id in game.player_moves:
-            # Get the player's move description
-            player_move = game.player_moves.get(user_id)
-            move_description = ""
-            
-            if game.game_type == GameType.DICE_ROLL:
-                move_description = f"rolled a 🎲 {player_move}"
-            elif game.game_type == GameType.COIN_FLIP:
-                move_str = player_move.capitalize() if hasattr(player_move, 'capitalize') else str(player_move).capitalize()
-                move_description = f"chose {move_str}"
-            elif game.game_type == GameType.NUMBER_GUESS:
-                move_description = f"picked the number {player_move}"
-            elif game.game_type == GameType.ROCK_PAPER_SCISSORS:
-                move_name = player_move.value.capitalize() if hasattr(player_move, 'value') else str(player_move).capitalize()
-                move_description = f"chose {move_name}"
-                
-            # Show a meaningful popup
-            await query.answer(f"You've already {move_description}! Wait for the game to complete.", show_alert=True)
-            
-            # Refresh the UI to ensure it reflects the correct state
-            keyboard = create_game_controls(game, user_id)
-            reply_markup = InlineKeyboardMarkup(keyboard)
+    # Check if the user has already made a move
+    if user_id in game.player_moves:
+        # Get the player's move description
+        move_description = _describe_move(game.game_type, game.player_moves.get(user_id))
             
-            try:
-                await query.edit_message_text(
-                    game.get_status_text(),
-                    reply_markup=reply_markup,
-                    parse_mode="Markdown"
-                )
-            except Exception as e:
-                print(f"Error updating game UI: {e}")
-                
-            return True
+        # Show a meaningful popup
+        await query.answer(f"You've already {move_description}! Wait for the game to complete.", show_alert=True)
+        
+        # Refresh the UI to ensure it reflects the correct state
+        keyboard = create_game_controls(game, user_id)
+        reply_markup = InlineKeyboardMarkup(keyboard)
+        
+        try:
+            await query.edit_message_text(
+                game.get_status_text(),
+                reply_markup=reply_markup,
+                parse_mode="Markdown"
+            )
+        except Exception as e:
+            logger.error(f"Error updating game UI: {e}")
             
-        return await process_make_move(query, game_id, user_id, move, context)
-    
-    elif callback_data.startswith(BTN_CANCEL_GAME):
-        # Cancel a betting game
-        _, game_id = callback_data.split(":", 1)
-        return await process_cancel_game(query, game_id, user_id)
-    
-    elif callback_data.startswith("refresh"):
-        # Refresh game status
-        _, game_id = callback_data.split(":", 1)
-        return await process_refresh_game(query, game_id, user_id)
-    
-    return False
+        return True
+        
+    return await process_make_move(query, game, user_id, move, context)
 
 async def process_join_game(query, game_id: str, user_id: int) -> bool:
     """Process a request to join a betting game."""
@@ -530,22 +679,11 @@ async def process_join_game(query, game_id: str, user_id: int) -> bool:
         full_name += f" {query.from_user.last_name}"
     game.player_full_names[user_id] = full_name
     
-    # Update the message with game controls for this player
-    keyboard = create_game_controls(game, user_id)
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    status_text = game.get_status_text()
     
     # Now the game has two players and has moved to WAITING_FOR_MOVES state
-    # We need to update both player's messages
-    
-    # Update this player's message (the player who just joined)
-    await query.edit_message_text(
-        f"🚨 *YOUR TURN* - MAKE YOUR MOVE BELOW! 🚨\n\n{game.get_status_text()}\n\nYou have joined the game! Make your move now.",
-        reply_markup=reply_markup,
-        parse_mode="Markdown"
-    )
-    
-    # Update the first player's message to let them know a second player has joined
-    # and they need to make a move
+    # We need to update both player's messages. The creator's edit is queued
+    # first so it goes out while we wait on the joiner's edit below.
     creator_id = game.creator_id
     if creator_id != user_id and creator_id in game.player_messages:
         try:
@@ -563,47 +701,36 @@ async def process_join_game(query, game_id: str, user_id: int) -> bool:
                 joiner_name = game.player_full_names[user_id]
                 
             # Create attention-grabbing message
-            await query.bot.edit_message_text(
-                f"🚨 *YOUR TURN* - MAKE YOUR MOVE BELOW! 🚨\n\n{game.get_status_text()}\n\n{joiner_name} has joined! It's your turn to make a move now.",
-                chat_id=chat_id,
-                message_id=message_id,
-                reply_markup=creator_reply_markup,
-                parse_mode="Markdown"
+            _queue_edit(
+                query.bot, chat_id, message_id,
+                f"🚨 *YOUR TURN* - MAKE YOUR MOVE BELOW! 🚨\n\n{status_text}\n\n{joiner_name} has joined! It's your turn to make a move now.",
+                creator_reply_markup
             )
         except Exception as e:
-            print(f"Error updating creator's message: {e}")
+            logger.error(f"Error updating creator's message: {e}")
+    
+    # Update this player's message (the player who just joined)
+    keyboard = create_game_controls(game, user_id)
+    reply_markup = InlineKeyboardMarkup(keyboard)
+    await query.edit_message_text(
+        f"🚨 *YOUR TURN* - MAKE YOUR MOVE BELOW! 🚨\n\n{status_text}\n\nYou have joined the game! Make your move now.",
+        reply_markup=reply_markup,
+        parse_mode="Markdown"
+    )
     
     return True
 
-async def process_make_move(query, game_id: str, user_id: int, move_str: str, context: ContextTypes.DEFAULT_TYPE = None) -> bool:
-    """Process a move in a betting game."""
-    game = get_betting_game(game_id)
-    if not game:
-        await query.edit_message_text("This game no longer exists.")
-        return True
-    
-    # Check if user is in the game
-    if user_id not in game.players:
-        # Just acknowledge the query but don't change anything for non-participants
-        await query.answer("You're not part of this game", show_alert=True)
-        return True
+async def process_make_move(query, game: BettingGame, user_id: int, move_str: str, context: ContextTypes.DEFAULT_TYPE = None) -> bool:
+    """
+    Process a move in a betting game.
+    The caller has already looked up the game under its lock and checked membership.
+    """
+    game_id = game.game_id
     
     # Check if user already made a move
     if user_id in game.player_moves:
         # Get the player's move and format it nicely
-        move = game.player_moves.get(user_id)
-        move_description = ""
-        
-        if game.game_type == GameType.DICE_ROLL:
-            move_description = f"rolled a 🎲 {move}"
-        elif game.game_type == GameType.COIN_FLIP:
-            move_str = move.capitalize() if hasattr(move, 'capitalize') else str(move).capitalize()
-            move_description = f"chose {move_str}"
-        elif game.game_type == GameType.NUMBER_GUESS:
-            move_description = f"picked the number {move}"
-        elif game.game_type == GameType.ROCK_PAPER_SCISSORS:
-            move_name = move.value.capitalize() if hasattr(move, 'value') else str(move).capitalize()
-            move_description = f"chose {move_name}"
+        move_description = _describe_move(game.game_type, game.player_moves.get(user_id))
             
         # Count how many players have moved
         players_moved = len(game.player_moves)
@@ -628,36 +755,15 @@ async def process_make_move(query, game_id: str, user_id: int, move_str: str, co
     
     # Parse the move based on game type
     parsed_move = None
-    if game.game_type == GameType.DICE_ROLL:
-        # For dice, we roll automatically
-        parsed_move = random.randint(1, 6)
-    elif game.game_type == GameType.COIN_FLIP:
-        if move_str not in ["heads", "tails"]:
+    move_parser = _MOVE_PARSERS.get(game.game_type)
+    if move_parser:
+        parse, error_text = move_parser
+        parsed_move = parse(move_str)
+        if parsed_move is None:
             await query.edit_message_text(
-                f"{game.get_status_text()}\n\nInvalid move. Choose heads or tails."
+                f"{game.get_status_text()}\n\n{error_text}"
             )
             return True
-        parsed_move = move_str
-    elif game.game_type == GameType.NUMBER_GUESS:
-        try:
-            parsed_move = int(move_str)
-            if parsed_move < 1 or parsed_move > 10:
-                await query.edit_message_text(
-                    f"{game.get_status_text()}\n\nInvalid number. Choose between 1 and 10."
-                )
-                return True
-        except ValueError:
-            await query.edit_message_text(
-                f"{game.get_status_text()}\n\nInvalid number. Choose between 1 and 10."
-            )
-            return True
-    elif game.game_type == GameType.ROCK_PAPER_SCISSORS:
-        if move_str not in ["rock", "paper", "scissors"]:
-            await query.edit_message_text(
-                f"{game.get_status_text()}\n\nInvalid move. Choose rock, paper, or scissors."
-            )
-            return True
-        parsed_move = PlayerMove(move_str)
     
     # Make the move
     success = game.make_move(user_id, parsed_move)
@@ -667,8 +773,7 @@ async def process_make_move(query, game_id: str, user_id: int, move_str: str, co
         )
         return True
         
-    # Reload the game to get the updated state
-    game = get_betting_game(game_id)
+    # make_move updated this game in place, so there is nothing to reload
     
     # Store this message's chat_id and message_id for the current player
     # This will be used to update all players when the game state changes
@@ -677,13 +782,8 @@ async def process_make_move(query, game_id: str, user_id: int, move_str: str, co
     
     # Create the appropriate keyboard for this specific user
     # This keeps the UI clean for the player who just moved
-    # Verify game is not None before calling create_game_controls
-    if game:
-        keyboard = create_game_controls(game, user_id)
-        reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
-    else:
-        # If game is None, we can't create controls, provide a simple fallback
-        reply_markup = None
+    keyboard = create_game_controls(game, user_id)
+    reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
     
     # Add instructions for each player based on their move status
     instructions = ""
@@ -715,135 +815,55 @@ async def process_make_move(query, game_id: str, user_id: int, move_str: str, co
     
     # If game is over, settle the bet (and check if game exists)
     if game and game.state == GameState.GAME_OVER:
+        # Render the final status once for every message below
+        status_text = game.get_status_text()
         try:
-            # Handle tie game case
-            if game.is_tie:
-                # Handle tie in single player mode
-                if game.single_player:
+            # Pay out (or refund) and compose the closing line, then edit once
+            settled = True
+            if game.single_player:
+                if game.is_tie:
                     # Add the bet amount back to the player
                     add_funds(user_id, game.bet_amount)
-                    await query.edit_message_text(
-                        f"{game.get_status_text()}\n\n🔄 It's a tie! Your {game.bet_amount} credits have been refunded.",
-                        parse_mode="Markdown"
-                    )
-                    # Remove the game
-                    remove_betting_game(game_id)
-                    return True
-                
-                # Handle tie in multiplayer mode - use settle_bet with None for winner_id to refund everyone
+                    body = f"🔄 It's a tie! Your {game.bet_amount} credits have been refunded."
+                elif game.winner_id == -1:
+                    # Bot won, no need to add funds to bot
+                    body = "🤖 Bot has won this round! Better luck next time!"
                 else:
-                    success, message, amount = settle_bet(game_id, None)  # None indicates a tie
-                    if success:
-                        # Update all players with the tie result
-                        tie_announcement = "🔄 It's a tie! All bets have been refunded."
-                        
-                        # Update all players with the final result
-                        for player_id, message_info in game.player_messages.items():
-                            if player_id != user_id:  # Skip the current user, they're handled by the query
-                                try:
-                                    chat_id, message_id = message_info
-                                    await context.bot.edit_message_text(
-                                        f"{game.get_status_text()}\n\n{tie_announcement}",
-                                        chat_id=chat_id,
-                                        message_id=message_id,
-                                        parse_mode="Markdown"
-                                    )
-                                except Exception as e:
-                                    print(f"Error updating player {player_id}: {e}")
-                        
-                        # Update the current player's message
-                        await query.edit_message_text(
-                            f"{game.get_status_text()}\n\n{tie_announcement}",
-                            parse_mode="Markdown"
-                        )
-                        # Remove the game
-                        remove_betting_game(game_id)
-                        return True
-                    else:
-                        await query.edit_message_text(
-                            f"{game.get_status_text()}\n\nError settling tie game: {message}",
-                            parse_mode="Markdown"
-                        )
-                        return True
+                    # Total pot is 2x bet amount since bot also "bet"
+                    total_pot = game.bet_amount * 2
+                    add_funds(game.winner_id, total_pot)
+                    body = f"🏆 {game.display_name(game.winner_id)} has won {total_pot} credits! 🏆"
+            else:
+                # settle_bet with None for winner_id refunds everyone on a tie
+                success, message, amount = settle_bet(game_id, None if game.is_tie else game.winner_id)
+                if not success:
+                    settled = False
+                    body = f"Error settling {'tie game' if game.is_tie else 'bet'}: {message}"
+                elif game.is_tie:
+                    body = "🔄 It's a tie! All bets have been refunded."
+                else:
+                    body = f"🏆 {game.display_name(game.winner_id)} has won {amount} credits! 🏆"
             
-            # Handle winner cases
-            winner_id = game.winner_id
+            final_text = f"{status_text}\n\n{body}"
             
-            # Special handling for single-player games against bot
-            if game.single_player and winner_id == -1:
-                # Bot won, no need to add funds to bot
-                await query.edit_message_text(
-                    f"{game.get_status_text()}\n\n🤖 Bot has won this round! Better luck next time!",
-                    parse_mode="Markdown"
-                )
-                # Remove the game
-                remove_betting_game(game_id)
-                return True
-                
-            # Human player won in single-player mode
-            elif game.single_player and winner_id != -1:
-                # Calculate total pot (2x bet amount since bot also "bet")
-                total_pot = game.bet_amount * 2
-                # Add winnings to the player
-                add_funds(winner_id, total_pot)
-                
-                # Get player's username for the winner announcement
-                winner_name = f"@{game.player_usernames.get(winner_id, 'Player')}" if winner_id in game.player_usernames else f"Player {winner_id}"
-                await query.edit_message_text(
-                    f"{game.get_status_text()}\n\n🏆 {winner_name} has won {total_pot} credits! 🏆",
-                    parse_mode="Markdown"
-                )
-                # Remove the game
+            # Update all other players with the final result
+            if settled and not game.single_player:
+                for player_id, message_info in game.player_messages.items():
+                    if player_id != user_id:  # Skip the current user, they're handled by the query
+                        try:
+                            chat_id, message_id = message_info
+                            _queue_edit(context.bot, chat_id, message_id, final_text)
+                        except Exception as e:
+                            logger.error(f"Error updating player {player_id}: {e}")
+            
+            # Update the current player's message
+            await query.edit_message_text(final_text, parse_mode="Markdown")
+            if settled:
                 remove_betting_game(game_id)
-                return True
-                
-            # Regular multiplayer game
-            else:
-                success, message, amount = settle_bet(game_id, winner_id)
-                if success:
-                    # Get winner username for direct mention
-                    winner_name = "Unknown"
-                    if winner_id == -1:
-                        winner_name = "🤖 Bot"
-                    elif winner_id in game.player_usernames:
-                        winner_name = f"@{game.player_usernames[winner_id]}"
-                    else:
-                        winner_name = f"Player {winner_id}"
-                    
-                    # Create a custom message that mentions the winner by username
-                    winner_announcement = f"🏆 {winner_name} has won {amount} credits! 🏆"
-                    
-                    # Update all players with the final result including winner mention
-                    for player_id, message_info in game.player_messages.items():
-                        if player_id != user_id:  # Skip the current user, they're handled by the query
-                            try:
-                                chat_id, message_id = message_info
-                                await context.bot.edit_message_text(
-                                    f"{game.get_status_text()}\n\n{winner_announcement}",
-                                    chat_id=chat_id,
-                                    message_id=message_id,
-                                    parse_mode="Markdown"
-                                )
-                            except Exception as e:
-                                print(f"Error updating player {player_id}: {e}")
-                    
-                    # Update the current player's message
-                    await query.edit_message_text(
-                        f"{game.get_status_text()}\n\n{winner_announcement}",
-                        parse_mode="Markdown"
-                    )
-                    # Remove the game
-                    remove_betting_game(game_id)
-                    return True
-                else:
-                    await query.edit_message_text(
-                        f"{game.get_status_text()}\n\nError settling bet: {message}",
-                        parse_mode="Markdown"
-                    )
-                    return True
+            return True
         except Exception as e:
             # Log the error for debugging
-            print(f"Error handling game completion: {e}")
+            logger.error(f"Error handling game completion: {e}")
             # Try to show a simple error message to the user
             try:
                 await query.answer(f"An error occurred while processing the game result. Please try again.", show_alert=True)
@@ -855,7 +875,8 @@ async def process_make_move(query, game_id: str, user_id: int, move_str: str, co
         # Include the instructions in the message if they exist
         # Make sure game exists before getting its status text
         if game:
-            message_text = game.get_status_text()
+            status_text = game.get_status_text()
+            message_text = status_text
             if instructions:
                 message_text += f"\n\n{instructions}"
         else:
@@ -881,7 +902,7 @@ async def process_make_move(query, game_id: str, user_id: int, move_str: str, co
                         player_reply_markup = InlineKeyboardMarkup(player_keyboard) if player_keyboard else None
                         
                         # Create player-specific message
-                        player_message = game.get_status_text()
+                        player_message = status_text
                         
                         # Add a clear instruction message at the top for the second player
                         if player_id not in game.player_moves:
@@ -907,18 +928,7 @@ async def process_make_move(query, game_id: str, user_id: int, move_str: str, co
                             player_message += "\n\nYour move has been recorded. Results will be shown automatically when all players have moved."
                         else:
                             # Show who made a move with proper mention by ID
-                            move_description = ""
-                            move = game.player_moves.get(user_id)
-                            if game.game_type == GameType.DICE_ROLL:
-                                move_description = f"rolled a 🎲 {move}"
-                            elif game.game_type == GameType.COIN_FLIP:
-                                move_str = move.capitalize() if hasattr(move, 'capitalize') else str(move).capitalize()
-                                move_description = f"chose {move_str}"
-                            elif game.game_type == GameType.NUMBER_GUESS:
-                                move_description = f"picked the number {move}"
-                            elif game.game_type == GameType.ROCK_PAPER_SCISSORS:
-                                move_name = move.value.capitalize() if hasattr(move, 'value') else str(move).capitalize()
-                                move_description = f"chose {move_name}"
+                            move_description = _describe_move(game.game_type, game.player_moves.get(user_id))
                             
                             # Get the current player's name/username for personalized message
                             player_name = "Unknown Player"
@@ -931,15 +941,9 @@ async def process_make_move(query, game_id: str, user_id: int, move_str: str, co
                             
                             player_message += f"\n\n{mover_mention} has {move_description}. It's {player_name}'s turn now!"
                         
-                        await context.bot.edit_message_text(
-                            player_message,
-                            chat_id=chat_id,
-                            message_id=message_id,
-                            reply_markup=player_reply_markup,
-                            parse_mode="Markdown"
-                        )
+                        _queue_edit(context.bot, chat_id, message_id, player_message, player_reply_markup)
                     except Exception as e:
-                        print(f"Error updating player {player_id}: {e}")
+                        logger.error(f"Error updating player {player_id}: {e}")
     
     return True
 
@@ -1092,7 +1096,19 @@ async def process_refresh_game(query, game_id: str, user_id: int) -> bool:
     
     return True
 
-def create_game_controls(game: BettingGame, user_id: int) -> List[List[InlineKeyboardButton]]:
+# Callback prefix -> handler; moves also get the parsed move and context
+_CALLBACK_HANDLERS = {
+    BTN_JOIN_GAME: process_join_game,
+    BTN_MAKE_MOVE: _process_move_callback,
+    BTN_CANCEL_GAME: process_cancel_game,
+    BTN_REFRESH: process_refresh_game,
+}
+
+# bot.py registers handle_betting_callback with this pattern, built from the
+# table above, so callbacks for other features never reach this module
+CALLBACK_PATTERN = "^(" + "|".join(_CALLBACK_HANDLERS) + "):"
+
+def create_game_controls(game: BettingGame, user_id: int) -> List[Tuple[InlineKeyboardButton, ...]]:
     """
     Create appropriate controls for the current game state.
     
@@ -1104,27 +1120,17 @@ def create_game_controls(game: BettingGame, user_id: int) -> List[List[InlineKey
     Each player has their own view of the game.
     """
     keyboard = []
+    rows = _control_rows(game.game_id)
     
     if game.state == GameState.WAITING_FOR_PLAYER:
         # Always show Join Game button when the game is waiting for players
         # This ensures other players can join even if the creator has viewed their own game
-        keyboard = [
-            [InlineKeyboardButton("Join Game", callback_data=f"{BTN_JOIN_GAME}:{game.game_id}")],
-            [InlineKeyboardButton("Cancel Game", callback_data=f"{BTN_CANCEL_GAME}:{game.game_id}")]
-        ]
+        keyboard = [rows.join, rows.cancel]
         
         # If user is already in the game, don't show them anything special
         # Instead, when they try to join, we'll show them an alert message
     
     elif game.state == GameState.WAITING_FOR_MOVES:
-        # For ALL move buttons, include the player status info
-        players_moved = len(game.player_moves)
-        total_players = len(game.players)
-        status_text = f"{players_moved}/{total_players} players have moved"
-        
-        # Common status button
-        status_button = [InlineKeyboardButton(status_text, callback_data="none")]
-        
         # Much simpler interface - show player buttons
         players_list = list(game.players)
         player1_id = players_list[0] if len(players_list) > 0 else None
@@ -1145,67 +1151,21 @@ def create_game_controls(game: BettingGame, user_id: int) -> List[List[InlineKey
         # Show different UI based on whether user has made their move and game state
         if user_id not in game.player_moves and game.state == GameState.WAITING_FOR_MOVES:
             # User hasn't made a move yet and game is waiting for moves
-            # Create multiple move options based on game type
-            if game.game_type == GameType.DICE_ROLL:
-                # For dice, simple single button
-                move_button = InlineKeyboardButton("🎲 Roll Dice", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:roll")
-                move_buttons = [[move_button]]
-            elif game.game_type == GameType.COIN_FLIP:
-                # For coin flip, show both options directly
-                heads_button = InlineKeyboardButton("Heads", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:heads")
-                tails_button = InlineKeyboardButton("Tails", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:tails")
-                move_buttons = [[heads_button, tails_button]]
-            elif game.game_type == GameType.ROCK_PAPER_SCISSORS:
-                # For RPS, show all three options
-                rock_button = InlineKeyboardButton("Rock 👊", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:rock")
-                paper_button = InlineKeyboardButton("Paper 🖐", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:paper")
-                scissors_button = InlineKeyboardButton("Scissors ✂️", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:scissors")
-                move_buttons = [[rock_button], [paper_button], [scissors_button]]
-            elif game.game_type == GameType.NUMBER_GUESS:
-                # For number guess, show 5 options in 2 rows
-                move_buttons = [
-                    [
-                        InlineKeyboardButton("1️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:1"),
-                        InlineKeyboardButton("2️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:2"),
-                        InlineKeyboardButton("3️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:3"),
-                        InlineKeyboardButton("4️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:4"),
-                        InlineKeyboardButton("5️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:5"),
-                    ],
-                    [
-                        InlineKeyboardButton("6️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:6"),
-                        InlineKeyboardButton("7️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:7"),
-                        InlineKeyboardButton("8️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:8"),
-                        InlineKeyboardButton("9️⃣", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:9"),
-                        InlineKeyboardButton("🔟", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:10"),
-                    ]
-                ]
-            else:
-                # Default fallback for unknown game types
-                move_button = InlineKeyboardButton("Make Move", callback_data=f"{BTN_MAKE_MOVE}:{game.game_id}:default")
-                move_buttons = [[move_button]]
-                
-            # Start with player status buttons
+            # Player status rows, instructions, all move buttons, then refresh at the bottom
             keyboard = [
-                [player1_button], 
-                [player2_button]
+                (player1_button,),
+                (player2_button,),
+                _YOUR_TURN_ROW,
+                *_move_buttons(game.game_type, game.game_id),
+                rows.refresh
             ]
-            
-            # Add game instruction
-            your_turn_button = InlineKeyboardButton("▶️ Your Turn - Choose Your Move ▶️", callback_data="none")
-            keyboard.append([your_turn_button])
-            
-            # Add all move buttons
-            keyboard.extend(move_buttons)
-            
-            # Add refresh button at the bottom
-            keyboard.append([InlineKeyboardButton("↻ Refresh", callback_data=f"refresh:{game.game_id}")])
         else:
             # Either user already made their move or game is not in the waiting for moves state
             # Show the player status and a refresh button only - no move buttons
             keyboard = [
-                [player1_button], 
-                [player2_button],
-                [InlineKeyboardButton("↻ Refresh Status", callback_data=f"refresh:{game.game_id}")]
+                (player1_button,),
+                (player2_button,),
+                rows.refresh_status
             ]
     
     # Add cancel button if game is not over, but only in certain states
@@ -1214,95 +1174,45 @@ def create_game_controls(game: BettingGame, user_id: int) -> List[List[InlineKey
     if (game.state == GameState.WAITING_FOR_MOVES and 
         game.creator_id == user_id and 
         user_id not in game.player_moves):
-        keyboard.append([InlineKeyboardButton("Cancel Game", callback_data=f"{BTN_CANCEL_GAME}:{game.game_id}")])
+        keyboard.append(rows.cancel)
     
     return keyboard
 
 # Direct game command handlers
-async def dice_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+async def _parse_bet_amount(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Optional[int]:
     """
-    Quick command to play a dice game against the bot.
-    Format: /dice [amount]
-    Default amount: 100 credits
+    Parse the optional [amount] argument of a quick command.
+    Replies with the problem and returns None if it isn't a positive number.
     """
-    # Set up bet amount (default or specified)
-    bet_amount = DEFAULT_BET_AMOUNT
-    if context.args:
-        try:
-            bet_amount = int(context.args[0])
-            if bet_amount <= 0:
-                await update.message.reply_text("Bet amount must be greater than 0.")
-                return
-        except ValueError:
-            await update.message.reply_text("Bet amount must be a number.")
-            return
-    
-    # Prepare arguments for the bet command
-    context.args = ["dice", str(bet_amount), "solo"]
-    await bet_command(update, context)
-
-async def coin_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """
-    Quick command to play a coin flip game against the bot.
-    Format: /coin [amount]
-    Default amount: 100 credits
-    """
-    # Set up bet amount (default or specified)
-    bet_amount = DEFAULT_BET_AMOUNT
-    if context.args:
-        try:
-            bet_amount = int(context.args[0])
-            if bet_amount <= 0:
-                await update.message.reply_text("Bet amount must be greater than 0.")
-                return
-        except ValueError:
-            await update.message.reply_text("Bet amount must be a number.")
-            return
-    
-    # Prepare arguments for the bet command
-    context.args = ["coin", str(bet_amount), "solo"]
-    await bet_command(update, context)
+    if not context.args:
+        return DEFAULT_BET_AMOUNT
+    try:
+        bet_amount = int(context.args[0])
+    except ValueError:
+        await update.message.reply_text("Bet amount must be a number.")
+        return None
+    if bet_amount <= 0:
+        await update.message.reply_text("Bet amount must be greater than 0.")
+        return None
+    return bet_amount
 
-async def number_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """
-    Quick command to play a number guessing game against the bot.
-    Format: /number [amount]
-    Default amount: 100 credits
-    """
-    # Set up bet amount (default or specified)
-    bet_amount = DEFAULT_BET_AMOUNT
-    if context.args:
-        try:
-            bet_amount = int(context.args[0])
-            if bet_amount <= 0:
-                await update.message.reply_text("Bet amount must be greater than 0.")
-                return
-        except ValueError:
-            await update.message.reply_text("Bet amount must be a number.")
+def _make_quick_command(game: str, description: str):
+    """Build a /<game> [amount] command that starts a solo game via bet_command."""
+    async def quick_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        bet_amount = await _parse_bet_amount(update, context)
+        if bet_amount is None:
             return
-    
-    # Prepare arguments for the bet command
-    context.args = ["number", str(bet_amount), "solo"]
-    await bet_command(update, context)
+        
+        # Prepare arguments for the bet command
+        context.args = [game, str(bet_amount), "solo"]
+        await bet_command(update, context)
+    
+    quick_command.__name__ = f"{game}_command"
+    quick_command.__qualname__ = quick_command.__name__
+    quick_command.__doc__ = f"Quick command to play {description} against the bot. Format: /{game} [amount]"
+    return quick_command
 
-async def rps_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """
-    Quick command to play rock-paper-scissors against the bot.
-    Format: /rps [amount]
-    Default amount: 100 credits
-    """
-    # Set up bet amount (default or specified)
-    bet_amount = DEFAULT_BET_AMOUNT
-    if context.args:
-        try:
-            bet_amount = int(context.args[0])
-            if bet_amount <= 0:
-                await update.message.reply_text("Bet amount must be greater than 0.")
-                return
-        except ValueError:
-            await update.message.reply_text("Bet amount must be a number.")
-            return
-    
-    # Prepare arguments for the bet command
-    context.args = ["rps", str(bet_amount), "solo"]
-    await bet_command(update, context)
\ No newline at end of file
+dice_command = _make_quick_command("dice", "a dice game")
+coin_command = _make_quick_command("coin", "a coin flip game")
+number_command = _make_quick_command("number", "a number guessing game")
+rps_command = _make_quick_command("rps", "rock-paper-scissors")
@@ -15,6 +15,7 @@ from telegram.ext import ContextTypes
 
 from betting_game import GameType, create_betting_game, get_betting_game, remove_betting_game
 from wallet_system import add_funds, deduct_funds, create_bet, settle_bet, get_balance
+from handlers.betting_handlers import solo_move_keyboard
 
 # Constants for crypto integration
 CCTIP_BOT_USERNAME = "cctip_bot"
@@ -32,6 +33,9 @@ SUPPORTED_CRYPTOCURRENCIES = {
     "bnb": 1.0,     # Min $1 of BNB
 }
 
+# Names accepted for rock-paper-scissors games
+_RPS_GAME_NAMES = frozenset(("rps", "rock", "paper", "scissors"))
+
 logger = logging.getLogger(__name__)
 
 async def crypto_bet_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -90,7 +94,7 @@ async def crypto_bet_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         game_type = GameType.COIN_FLIP
     elif game_type_str == "number":
         game_type = GameType.NUMBER_GUESS
-    elif game_type_str in ["rps", "rock", "paper", "scissors"]:
+    elif game_type_str in _RPS_GAME_NAMES:
         game_type = GameType.ROCK_PAPER_SCISSORS
     else:
         await update.message.reply_text(
@@ -260,45 +264,14 @@ async def process_crypto_payment(context, sender: str, bet_id: str, amount: floa
         game_type = GameType.COIN_FLIP
     elif game_type_str == "number":
         game_type = GameType.NUMBER_GUESS
-    elif game_type_str in ["rps", "rock", "paper", "scissors"]:
+    elif game_type_str in _RPS_GAME_NAMES:
         game_type = GameType.ROCK_PAPER_SCISSORS
     
     # Create the betting game (single player vs. bot)
     game = create_betting_game(game_type, user_id, virtual_amount, single_player=True)
     
-    # Create appropriate game buttons
-    keyboard = []
-    
-    if game_type == GameType.DICE_ROLL:
-        # Dice game - player just rolls
-        keyboard = [[InlineKeyboardButton("🎲 Roll Dice", callback_data=f"betting_game_move:{game.game_id}:roll")]]
-    
-    elif game_type == GameType.COIN_FLIP:
-        # Coin flip - player guesses heads or tails
-        keyboard = [
-            [
-                InlineKeyboardButton("Heads", callback_data=f"betting_game_move:{game.game_id}:heads"),
-                InlineKeyboardButton("Tails", callback_data=f"betting_game_move:{game.game_id}:tails")
-            ]
-        ]
-        
-    elif game_type == GameType.NUMBER_GUESS:
-        # Number guessing - provide number buttons 1-10
-        row1 = [InlineKeyboardButton(str(i), callback_data=f"betting_game_move:{game.game_id}:{i}") for i in range(1, 6)]
-        row2 = [InlineKeyboardButton(str(i), callback_data=f"betting_game_move:{game.game_id}:{i}") for i in range(6, 11)]
-        keyboard = [row1, row2]
-        
-    elif game_type == GameType.ROCK_PAPER_SCISSORS:
-        # Rock Paper Scissors - provide RPS buttons
-        keyboard = [
-            [
-                InlineKeyboardButton("🪨 Rock", callback_data=f"betting_game_move:{game.game_id}:rock"),
-                InlineKeyboardButton("📄 Paper", callback_data=f"betting_game_move:{game.game_id}:paper"),
-                InlineKeyboardButton("✂️ Scissors", callback_data=f"betting_game_move:{game.game_id}:scissors")
-            ]
-        ]
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    # Same cached move buttons as /bet ... solo
+    reply_markup = solo_move_keyboard(game_type, game.game_id)
     
     # Send acknowledgment and game start using plain text
     await message.reply_text(
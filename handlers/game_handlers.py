@@ -2,6 +2,7 @@
 Game handlers for the Telegram bot.
 """
 import re
+import asyncio
 import logging
 from typing import Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
@@ -20,14 +21,25 @@ async def checkers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     chat_id = update.effective_chat.id
     user_id = update.effective_user.id
     
-    # Check if there's already an active game in this chat
-    if chat_id in active_games:
-        game = active_games[chat_id]
-        await update.message.reply_text(
-            "There's already an active checkers game in this chat. "
-            "Finish it or use /endcheckers to end it first."
-        )
-        return
+    # Check if playing against another user or the bot
+    opponent_username = None
+    if context.args and len(context.args) > 0:
+        opponent_username = context.args[0].replace("@", "")
+    
+    # Check for and register the game under the chat's lock, so two concurrent
+    # /checkers commands can't both start one
+    async with active_games.lock(chat_id):
+        # Check if there's already an active game in this chat
+        if chat_id in active_games:
+            await update.message.reply_text(
+                "There's already an active checkers game in this chat. "
+                "Finish it or use /endcheckers to end it first."
+            )
+            return
+        
+        # A human opponent will need to join; None indicates the AI opponent
+        game = CheckersGame(user_id) if opponent_username else CheckersGame(user_id, None)
+        active_games[chat_id] = game
     
     # First, send the rules and FAQ
     rules_text = (
@@ -62,16 +74,7 @@ async def checkers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     
     await update.message.reply_markdown(rules_text)
     
-    # Check if playing against another user or the bot
-    opponent_username = None
-    if context.args and len(context.args) > 0:
-        opponent_username = context.args[0].replace("@", "")
-    
     if opponent_username:
-        # Create a game with a human opponent (they'll need to join)
-        game = CheckersGame(user_id)
-        active_games[chat_id] = game
-        
         # Create the join game button
         keyboard = [
             [InlineKeyboardButton("Join Game", callback_data=f"join_checkers:{user_id}")],
@@ -85,10 +88,6 @@ async def checkers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             reply_markup=reply_markup
         )
     else:
-        # Create a game against the AI
-        game = CheckersGame(user_id, None)  # None indicates AI opponent
-        active_games[chat_id] = game
-        
         # Show the initial board
         board_text = game.get_board_as_string()
         status_text = game.get_game_status()
@@ -112,8 +111,12 @@ async def end_checkers_command(update: Update, context: ContextTypes.DEFAULT_TYP
     """End the current checkers game in the chat."""
     chat_id = update.effective_chat.id
     
-    if chat_id in active_games:
-        del active_games[chat_id]
+    # Wait for any move in progress so it can't finish on a removed game
+    async with active_games.with_game(chat_id) as game:
+        if game is not None:
+            active_games.remove(chat_id)
+    
+    if game is not None:
         await update.message.reply_text("The checkers game has been ended.")
     else:
         await update.message.reply_text("There's no active checkers game in this chat.")
@@ -166,45 +169,51 @@ async def process_move(update: Update, context: ContextTypes.DEFAULT_TYPE, move_
     if chat_id not in active_games:
         return
     
-    game = active_games[chat_id]
-    
-    # Check if it's game over
-    if game.state == GameState.GAME_OVER:
-        await update.message.reply_text(
-            f"This game is already over. {game.get_game_status()}\n"
-            f"Start a new game with /checkers."
-        )
-        return
-    
-    # Check if it's this user's turn
-    is_user_turn = False
-    if game.current_turn.name == "WHITE" and game.user_id1 == user_id:
-        is_user_turn = True
-    elif game.current_turn.name == "BLACK" and game.user_id2 == user_id:
-        is_user_turn = True
-    
-    if not is_user_turn and user_id != update.effective_chat.id:  # Allow moves in private chat
-        await update.message.reply_text("It's not your turn!")
-        return
-    
-    # Parse and validate the move
-    from_pos, to_pos = game.parse_move(move_text)
-    if from_pos is None or to_pos is None:
-        await update.message.reply_text(
-            "Invalid move format. Please use the format A3-B4."
-        )
-        return
-    
-    # Make the move
-    if not game.make_move(from_pos, to_pos):
-        await update.message.reply_text(
-            "Invalid move. Please try again."
-        )
-        return
-    
-    # Update the game display
-    board_text = game.get_board_as_string()
-    status_text = game.get_game_status()
+    async with active_games.with_game(chat_id) as game:
+        if game is None:
+            return
+        
+        # Check if it's game over
+        if game.state == GameState.GAME_OVER:
+            await update.message.reply_text(
+                f"This game is already over. {game.get_game_status()}\n"
+                f"Start a new game with /checkers."
+            )
+            return
+        
+        # Check if it's this user's turn
+        is_user_turn = False
+        if game.current_turn.name == "WHITE" and game.user_id1 == user_id:
+            is_user_turn = True
+        elif game.current_turn.name == "BLACK" and game.user_id2 == user_id:
+            is_user_turn = True
+        
+        if not is_user_turn and user_id != update.effective_chat.id:  # Allow moves in private chat
+            await update.message.reply_text("It's not your turn!")
+            return
+        
+        # Parse and validate the move
+        from_pos, to_pos = game.parse_move(move_text)
+        if from_pos is None or to_pos is None:
+            await update.message.reply_text(
+                "Invalid move format. Please use the format A3-B4."
+            )
+            return
+        
+        # Make the move; the AI reply is searched in a worker thread so other chats aren't held up
+        if not await asyncio.to_thread(game.make_move, from_pos, to_pos):
+            await update.message.reply_text(
+                "Invalid move. Please try again."
+            )
+            return
+        
+        # Update the game display
+        board_text = game.get_board_as_string()
+        status_text = game.get_game_status()
+        
+        # Finished games are dropped so a new one can be started right away
+        if game.state == GameState.GAME_OVER:
+            active_games.remove(chat_id)
     
     # Create the move button
     keyboard = [
@@ -285,87 +294,86 @@ async def handle_checkers_callback(update: Update, context: ContextTypes.DEFAULT
         # Handle joining a game
         creator_id = int(data.split(":")[1])
         
-        if chat_id not in active_games:
-            await query.edit_message_text(
-                "This game is no longer available."
-            )
-            return
-        
-        game = active_games[chat_id]
-        
-        if game.user_id1 == user_id:
-            await query.edit_message_text(
-                "You can't join your own game!"
-            )
-            return
-        
-        if game.user_id2 is not None:
+        # Hold the chat lock so joining can't race a move running in a worker thread
+        async with active_games.with_game(chat_id) as game:
+            if game is None:
+                await query.edit_message_text(
+                    "This game is no longer available."
+                )
+                return
+            
+            if game.user_id1 == user_id:
+                await query.edit_message_text(
+                    "You can't join your own game!"
+                )
+                return
+            
+            if game.user_id2 is not None:
+                await query.edit_message_text(
+                    "Someone has already joined this game."
+                )
+                return
+            
+            # Join the game
+            game.user_id2 = user_id
+            game.state = GameState.WAITING_FOR_MOVE
+            
+            # Show the initial board
+            board_text = game.get_board_as_string()
+            status_text = game.get_game_status()
+            
+            # Create the move button
+            keyboard = [
+                [InlineKeyboardButton("Make a Move", callback_data="move_checkers")],
+                [InlineKeyboardButton("Game Rules", callback_data="checkers_rules")]
+            ]
+            reply_markup = InlineKeyboardMarkup(keyboard)
+            
             await query.edit_message_text(
-                "Someone has already joined this game."
+                f"🎮 {query.from_user.first_name} has joined the game of Checkers!\n\n"
+                f"{board_text}\n"
+                f"{status_text}\n\n"
+                f"Use the button below to make a move or type a move in the format: A3-B4",
+                reply_markup=reply_markup
             )
-            return
-        
-        # Join the game
-        game.user_id2 = user_id
-        game.state = GameState.WAITING_FOR_MOVE
-        
-        # Show the initial board
-        board_text = game.get_board_as_string()
-        status_text = game.get_game_status()
-        
-        # Create the move button
-        keyboard = [
-            [InlineKeyboardButton("Make a Move", callback_data="move_checkers")],
-            [InlineKeyboardButton("Game Rules", callback_data="checkers_rules")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await query.edit_message_text(
-            f"🎮 {query.from_user.first_name} has joined the game of Checkers!\n\n"
-            f"{board_text}\n"
-            f"{status_text}\n\n"
-            f"Use the button below to make a move or type a move in the format: A3-B4",
-            reply_markup=reply_markup
-        )
     
     elif data == "move_checkers":
         # Show dialog for making a move
-        if chat_id not in active_games:
-            await query.edit_message_text(
-                "This game is no longer available."
+        async with active_games.with_game(chat_id) as game:
+            if game is None:
+                await query.edit_message_text(
+                    "This game is no longer available."
+                )
+                return
+            
+            # Check if it's game over
+            if game.state == GameState.GAME_OVER:
+                await query.edit_message_text(
+                    f"This game is already over. {game.get_game_status()}\n"
+                    f"Start a new game with /checkers."
+                )
+                return
+            
+            # Show current board and prompt for move
+            board_text = game.get_board_as_string()
+            status_text = game.get_game_status()
+            
+            await context.bot.send_message(
+                chat_id=user_id,  # Send as private message to the user
+                text=f"🎮 Checkers Game\n\n"
+                     f"{board_text}\n"
+                     f"{status_text}\n\n"
+                     f"Enter your move in the format: A3-B4"
             )
-            return
-        
-        game = active_games[chat_id]
-        
-        # Check if it's game over
-        if game.state == GameState.GAME_OVER:
+            
+            # Update the original message to show waiting for a move
+            current_player = "Player 1 (White)" if game.current_turn.name == "WHITE" else "Player 2 (Black)"
             await query.edit_message_text(
-                f"This game is already over. {game.get_game_status()}\n"
-                f"Start a new game with /checkers."
+                f"🎮 Checkers Game\n\n"
+                f"{board_text}\n"
+                f"{status_text}\n\n"
+                f"Waiting for {current_player} to make a move..."
             )
-            return
-        
-        # Show current board and prompt for move
-        board_text = game.get_board_as_string()
-        status_text = game.get_game_status()
-        
-        await context.bot.send_message(
-            chat_id=user_id,  # Send as private message to the user
-            text=f"🎮 Checkers Game\n\n"
-                 f"{board_text}\n"
-                 f"{status_text}\n\n"
-                 f"Enter your move in the format: A3-B4"
-        )
-        
-        # Update the original message to show waiting for a move
-        current_player = "Player 1 (White)" if game.current_turn.name == "WHITE" else "Player 2 (Black)"
-        await query.edit_message_text(
-            f"🎮 Checkers Game\n\n"
-            f"{board_text}\n"
-            f"{status_text}\n\n"
-            f"Waiting for {current_player} to make a move..."
-        )
 
 # Function to handle checkers move messages in private chat
 async def handle_checkers_move_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
@@ -395,38 +403,48 @@ async def handle_checkers_move_message(update: Update, context: ContextTypes.DEF
         # Only one active game, make the move
         chat_id, game = user_games[0]
         
-        # Check if it's this user's turn
-        is_user_turn = False
-        if game.current_turn.name == "WHITE" and game.user_id1 == user_id:
-            is_user_turn = True
-        elif game.current_turn.name == "BLACK" and game.user_id2 == user_id:
-            is_user_turn = True
-        
-        if not is_user_turn:
-            await update.message.reply_text("It's not your turn!")
-            return True
-        
-        # Process the move
-        move_text = message_text.strip()
-        
-        # Parse and validate the move
-        from_pos, to_pos = game.parse_move(move_text)
-        if from_pos is None or to_pos is None:
-            await update.message.reply_text(
-                "Invalid move format. Please use the format A3-B4."
-            )
-            return True
-        
-        # Make the move
-        if not game.make_move(from_pos, to_pos):
-            await update.message.reply_text(
-                "Invalid move. Please try again."
-            )
-            return True
-        
-        # Update the game display
-        board_text = game.get_board_as_string()
-        status_text = game.get_game_status()
+        async with active_games.with_game(chat_id) as current:
+            # The game may have been ended or replaced while we waited for the lock
+            if current is not game:
+                await update.message.reply_text("This checkers game is no longer active.")
+                return True
+            
+            # Check if it's this user's turn
+            is_user_turn = False
+            if game.current_turn.name == "WHITE" and game.user_id1 == user_id:
+                is_user_turn = True
+            elif game.current_turn.name == "BLACK" and game.user_id2 == user_id:
+                is_user_turn = True
+            
+            if not is_user_turn:
+                await update.message.reply_text("It's not your turn!")
+                return True
+            
+            # Process the move
+            move_text = message_text.strip()
+            
+            # Parse and validate the move
+            from_pos, to_pos = game.parse_move(move_text)
+            if from_pos is None or to_pos is None:
+                await update.message.reply_text(
+                    "Invalid move format. Please use the format A3-B4."
+                )
+                return True
+            
+            # Make the move; the AI reply is searched in a worker thread so other chats aren't held up
+            if not await asyncio.to_thread(game.make_move, from_pos, to_pos):
+                await update.message.reply_text(
+                    "Invalid move. Please try again."
+                )
+                return True
+            
+            # Update the game display
+            board_text = game.get_board_as_string()
+            status_text = game.get_game_status()
+            
+            # Finished games are dropped so a new one can be started right away
+            if game.state == GameState.GAME_OVER:
+                active_games.remove(chat_id)
         
         # Send updated board to the user
         await update.message.reply_text(
@@ -229,22 +229,23 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     await query.answer()
     
+    # Split "<action>:<payload>" callbacks once; branches below use the parts
+    action, _, payload = query.data.partition(":")
+    
     # Handle YouTube download callbacks
-    if query.data.startswith("download_yt_video:"):
-        url = query.data.split(":", 1)[1]
-        await download_youtube_video(query, context, url)
+    if action == "download_yt_video":
+        await download_youtube_video(query, context, payload)
     
-    elif query.data.startswith("extract_yt_audio:"):
-        url = query.data.split(":", 1)[1]
-        await extract_youtube_audio(query, context, url)
+    elif action == "extract_yt_audio":
+        await extract_youtube_audio(query, context, payload)
     
     # Handle social media download callbacks
-    elif query.data.startswith("download_sm_video:"):
-        _, platform, url = query.data.split(":", 2)
+    elif action == "download_sm_video":
+        platform, _, url = payload.partition(":")
         await download_social_media_video(query, context, url, platform)
     
-    elif query.data.startswith("extract_sm_audio:"):
-        _, platform, url = query.data.split(":", 2)
+    elif action == "extract_sm_audio":
+        platform, _, url = payload.partition(":")
         await extract_social_media_audio(query, context, url, platform)
     
     # Handle direct betting game buttons from start menu
@@ -271,6 +272,7 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         # Map game type string to GameType enum
         from betting_game import GameType, create_betting_game, PlayerMove
         from wallet_system import get_balance, deduct_funds, settle_bet
+        from handlers.betting_handlers import solo_move_keyboard
         
         game_type_enum = None
         if game_type == "dice":
@@ -306,39 +308,8 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         # Create a single-player game with the bot
         game = create_betting_game(game_type_enum, user_id, bet_amount, single_player=True)
         
-        # Use different buttons based on game type
-        keyboard = []
-        
-        if game_type_enum == GameType.DICE_ROLL:
-            # Dice game - player just rolls
-            keyboard = [[InlineKeyboardButton("🎲 Roll Dice", callback_data=f"betting_game_move:{game.game_id}:roll")]]
-        
-        elif game_type_enum == GameType.COIN_FLIP:
-            # Coin flip - player guesses heads or tails
-            keyboard = [
-                [
-                    InlineKeyboardButton("Heads", callback_data=f"betting_game_move:{game.game_id}:heads"),
-                    InlineKeyboardButton("Tails", callback_data=f"betting_game_move:{game.game_id}:tails")
-                ]
-            ]
-            
-        elif game_type_enum == GameType.NUMBER_GUESS:
-            # Number guessing - provide number buttons 1-10
-            row1 = [InlineKeyboardButton(str(i), callback_data=f"betting_game_move:{game.game_id}:{i}") for i in range(1, 6)]
-            row2 = [InlineKeyboardButton(str(i), callback_data=f"betting_game_move:{game.game_id}:{i}") for i in range(6, 11)]
-            keyboard = [row1, row2]
-            
-        elif game_type_enum == GameType.ROCK_PAPER_SCISSORS:
-            # Rock Paper Scissors - provide RPS buttons
-            keyboard = [
-                [
-                    InlineKeyboardButton("🪨 Rock", callback_data=f"betting_game_move:{game.game_id}:rock"),
-                    InlineKeyboardButton("📄 Paper", callback_data=f"betting_game_move:{game.game_id}:paper"),
-                    InlineKeyboardButton("✂️ Scissors", callback_data=f"betting_game_move:{game.game_id}:scissors")
-                ]
-            ]
-            
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        # Same cached move buttons as /bet ... solo
+        reply_markup = solo_move_keyboard(game_type_enum, game.game_id)
         
         # Send game info
         await query.message.reply_markdown(
@@ -392,16 +363,13 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
     
     # Handle translation callbacks
-    elif query.data.startswith("translate:"):
+    elif action == "translate":
         try:
             # Format: translate:lang_code:original_text
-            parts = query.data.split(":", 2)
-            if len(parts) < 3:
+            target_lang, sep, original_text = payload.partition(":")
+            if not sep:
                 await query.message.reply_text("❌ Invalid translation request")
                 return
-                
-            target_lang = parts[1]
-            original_text = parts[2]
             
             # If the original text was cut (limited to 50 chars), use the message text
             if len(original_text) < 50 and "..." not in original_text:
@@ -428,15 +396,10 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             await query.message.reply_text("❌ Translation failed. Please try again.")
     
     # Handle translation help menu callbacks
-    elif query.data.startswith("translate_help:"):
+    elif action == "translate_help":
         try:
             # Format: translate_help:lang_code
-            parts = query.data.split(":", 1)
-            if len(parts) < 2:
-                await query.message.reply_text("❌ Invalid language selection")
-                return
-                
-            target_lang = parts[1]
+            target_lang = payload
             from bot import translate_text
             
             help_text = (
@@ -8,7 +8,7 @@ import requests
 from typing import Dict, Optional, Any, Tuple
 import yt_dlp
 
-from config import DOWNLOADS_FOLDER
+from config import DOWNLOADS_FOLDER, ensure_downloads_dir
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +117,7 @@ class SocialMediaService:
             Tuple[Optional[str], Optional[str]]: (file_path, error_message)
         """
         # Ensure the downloads directory exists
-        os.makedirs(DOWNLOADS_FOLDER, exist_ok=True)
+        ensure_downloads_dir()
         
         platform = SocialMediaService.identify_platform(url)
         
@@ -220,7 +220,7 @@ class SocialMediaService:
             Tuple[Optional[str], Optional[str]]: (file_path, error_message)
         """
         # Ensure the downloads directory exists
-        os.makedirs(DOWNLOADS_FOLDER, exist_ok=True)
+        ensure_downloads_dir()
         
         platform = SocialMediaService.identify_platform(url)
         
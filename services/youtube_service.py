@@ -9,7 +9,7 @@ import json
 from pathlib import Path
 import yt_dlp
 
-from config import DOWNLOADS_FOLDER
+from config import DOWNLOADS_FOLDER, ensure_downloads_dir
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +74,7 @@ class YouTubeService:
             str: Path to the downloaded file, or error message
         """
         # Ensure the downloads directory exists
-        os.makedirs(DOWNLOADS_FOLDER, exist_ok=True)
+        ensure_downloads_dir()
         
         # Create a unique filename based on the URL
         filename = f"youtube_{hash(url) % 1000000}.mp4"
@@ -119,7 +119,7 @@ class YouTubeService:
             str: Path to the downloaded audio file, or error message
         """
         # Ensure the downloads directory exists
-        os.makedirs(DOWNLOADS_FOLDER, exist_ok=True)
+        ensure_downloads_dir()
         
         # Create a unique filename based on the URL
         filename = f"youtube_audio_{hash(url) % 1000000}.mp3"
@@ -2,6 +2,9 @@
 Wallet system for tracking user balances in the Telegram bot.
 This is a virtual wallet system for testing purposes only - no real money is involved.
 """
+import asyncio
+import atexit
+import heapq
 import json
 import os
 import logging
@@ -10,6 +13,8 @@ from typing import Dict, Tuple, Optional, List
 # Constants
 DEFAULT_BALANCE = 1000  # Default starting balance
 WALLET_FILE = "user_wallets.json"
+ADMIN_ID = 1159603709  # The only user allowed to run admin wallet commands
+_SAVE_DELAY = 0.05  # Seconds to coalesce wallet writes for
 
 # Data structures
 wallets = {}  # {user_id: balance}
@@ -17,6 +22,10 @@ active_bets = {}  # {bet_id: {creator_id, amount, participants: {user_id: amount
 
 logger = logging.getLogger(__name__)
 
+# True while a deferred save is scheduled / a background write is running
+_save_pending = False
+_write_in_flight = False
+
 def load_wallets() -> None:
     """Load wallet data from file."""
     global wallets, active_bets
@@ -46,15 +55,63 @@ def load_wallets() -> None:
             active_bets = {}
 
 def save_wallets() -> None:
-    """Save wallet data to file."""
-    data = {
+    """
+    Save wallet data to file.
+    
+    Inside the bot's event loop the write is deferred by _SAVE_DELAY so a burst
+    of balance changes (e.g. settling a bet) shares a single file write, and the
+    file itself is written from a worker thread so the loop never blocks on disk.
+    """
+    global _save_pending
+    if _save_pending:
+        return
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (scripts, shutdown) - write straight away
+        _write_payload(_dump_wallets())
+        return
+    
+    _save_pending = True
+    if not _write_in_flight:
+        loop.call_later(_SAVE_DELAY, _flush_in_background)
+
+def flush_wallets() -> None:
+    """Write any pending wallet changes to file now."""
+    global _save_pending
+    if _save_pending:
+        _save_pending = False
+        _write_payload(_dump_wallets())
+
+def _flush_in_background() -> None:
+    """Snapshot the wallets on the loop and write them from a worker thread."""
+    global _save_pending, _write_in_flight
+    if not _save_pending:
+        return
+    _save_pending = False
+    _write_in_flight = True
+    loop = asyncio.get_running_loop()
+    write = loop.run_in_executor(None, _write_payload, _dump_wallets())
+    write.add_done_callback(_on_write_done)
+
+def _on_write_done(_write) -> None:
+    # One write at a time keeps the file in order; pick up changes made meanwhile
+    global _write_in_flight
+    _write_in_flight = False
+    if _save_pending:
+        asyncio.get_running_loop().call_later(_SAVE_DELAY, _flush_in_background)
+
+def _dump_wallets() -> str:
+    return json.dumps({
         'wallets': wallets,
         'active_bets': active_bets
-    }
-    
+    }, indent=2)
+
+def _write_payload(payload: str) -> None:
     try:
         with open(WALLET_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write(payload)
     except IOError as e:
         logger.error(f"Error saving wallet data: {e}")
 
@@ -263,6 +320,13 @@ def settle_bet(bet_id: str, winner_id: Optional[int] = None) -> Tuple[bool, str,
     
     return True, f"Congratulations! You won {total_pot} credits!", total_pot
 
+def set_balance(user_id: int, amount: int) -> int:
+    """Set a user's balance in one write and return it."""
+    wallets[user_id] = amount
+    save_wallets()
+    
+    return amount
+
 def reset_wallet(user_id: int) -> Tuple[bool, int]:
     """
     Reset a user's wallet to the default starting balance.
@@ -273,10 +337,7 @@ def reset_wallet(user_id: int) -> Tuple[bool, int]:
     Returns:
         Tuple of (success, new_balance)
     """
-    wallets[user_id] = DEFAULT_BALANCE
-    save_wallets()
-    
-    return True, DEFAULT_BALANCE
+    return True, set_balance(user_id, DEFAULT_BALANCE)
 
 # Admin functions
 def admin_set_balance(admin_id: int, user_id: int, new_balance: int) -> Tuple[bool, str]:
@@ -292,14 +353,13 @@ def admin_set_balance(admin_id: int, user_id: int, new_balance: int) -> Tuple[bo
         Tuple of (success, message)
     """
     # Check if admin has privilege
-    if admin_id != 1159603709:
+    if admin_id != ADMIN_ID:
         return False, "You don't have admin privileges to perform this action."
     
     if new_balance < 0:
         return False, "Balance cannot be negative."
     
-    wallets[user_id] = new_balance
-    save_wallets()
+    set_balance(user_id, new_balance)
     
     return True, f"User {user_id}'s balance has been set to {new_balance} credits."
 
@@ -316,7 +376,7 @@ def admin_add_balance(admin_id: int, user_id: int, amount: int) -> Tuple[bool, s
         Tuple of (success, message)
     """
     # Check if admin has privilege
-    if admin_id != 1159603709:
+    if admin_id != ADMIN_ID:
         return False, "You don't have admin privileges to perform this action."
     
     if amount <= 0:
@@ -343,7 +403,7 @@ def admin_remove_balance(admin_id: int, user_id: int, amount: int) -> Tuple[bool
         Tuple of (success, message)
     """
     # Check if admin has privilege
-    if admin_id != 1159603709:
+    if admin_id != ADMIN_ID:
         return False, "You don't have admin privileges to perform this action."
     
     if amount <= 0:
@@ -373,10 +433,33 @@ def admin_list_all_wallets(admin_id: int) -> Tuple[bool, Dict[int, int]]:
         Tuple of (success, wallet_data)
     """
     # Check if admin has privilege
-    if admin_id != 1159603709:
+    if admin_id != ADMIN_ID:
         return False, {}
     
     return True, wallets
 
+def admin_list_wallets_page(admin_id: int, offset: int, limit: int) -> Tuple[bool, List[Tuple[int, int]], int]:
+    """
+    Admin function to list one page of wallets, highest balance first.
+    
+    Args:
+        admin_id: The ID of the admin performing the action
+        offset: Number of wallets to skip
+        limit: Maximum number of wallets to return
+        
+    Returns:
+        Tuple of (success, [(user_id, balance), ...], total_wallets)
+    """
+    # Check if admin has privilege
+    if admin_id != ADMIN_ID:
+        return False, [], 0
+    
+    # Only the wallets up to the end of this page need ordering
+    top = heapq.nlargest(offset + limit, wallets.items(), key=lambda item: item[1])
+    return True, top[offset:], len(wallets)
+
 # Load data when module is imported
-load_wallets()
\ No newline at end of file
+load_wallets()
+
+# Don't lose a deferred save when the bot exits
+atexit.register(flush_wallets)
\ No newline at end of file